@@ -1,13 +1,61 @@
-from fastapi import FastAPI, Request, Response
+from fastapi import FastAPI, Request, Response, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
+from starlette.background import BackgroundTask
+import argparse
+import asyncio
+import atexit
+import bisect
+import collections
+import hashlib
+import hmac
 import io
+import itertools
+import json
+import logging
+import logging.handlers
+import math
+import multiprocessing
+import os
+import queue
+import random
+import signal
+import socket
+import struct
+import sys
+import tempfile
+import threading
+import time
+import zipfile
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from multiprocessing import shared_memory
 from PIL import Image
 import numpy as np
 import onnxruntime as ort
 import uvicorn
 
-app = FastAPI(title="Sila Sign Language Recognition API")
+try:
+    from python_multipart.multipart import MultipartParser, parse_options_header
+except ImportError:  # python-multipart before 0.0.13
+    from multipart.multipart import MultipartParser, parse_options_header
+
+try:
+    import orjson  # Optional: faster JSON for the per-frame responses
+except ImportError:
+    orjson = None
+
+@asynccontextmanager
+async def lifespan(app):
+    # Load the model off the startup path so the process comes up (and reports liveness) immediately
+    threading.Thread(target=load_model, name="model-loader", daemon=True).start()
+    worker_pool.start()
+    yield
+    worker_pool.stop()
+
+
+app = FastAPI(title="Sila Sign Language Recognition API", lifespan=lifespan)
 
 # Enable CORS for frontend
 app.add_middleware(
@@ -17,139 +65,1888 @@ app.add_middleware(
     allow_headers=["*"],  # Allow all headers
 )
 
-# Global variables
-model_path = "assets/model.onnx"
-session = None
+# ========================================
+# Logging: level-gated, written by a background thread
+# ========================================
+log_level = os.environ.get("SILA_LOG_LEVEL", "INFO").upper()
+trace_every = int(os.environ.get("SILA_TRACE_EVERY", "0"))  # Log full per-frame detail for 1 in N frames (0 = off)
+
+logger = logging.getLogger("sila")
+
+
+def setup_logging():
+    """Route the sila logger through a queue so request threads never block on stdout"""
+    if logger.handlers:
+        return
+    log_queue = queue.SimpleQueue()
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+    listener = logging.handlers.QueueListener(log_queue, handler, respect_handler_level=True)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.setLevel(log_level)
+    logger.propagate = False
+    listener.start()
+    atexit.register(listener.stop)
+
+
+def restart_logging_after_fork():
+    """The listener thread does not survive fork(); give each pre-forked worker its own"""
+    logger.handlers.clear()
+    setup_logging()
+
+
+setup_logging()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=restart_logging_after_fork)
+frame_counter = itertools.count(1)
+
+
+def frame_trace_level():
+    """Level to log this frame's detail at, or None to skip building it entirely.
+
+    Every frame is traced at DEBUG when that level is on; otherwise 1 in
+    trace_every frames is sampled and logged at INFO.
+    """
+    if trace_every > 0 and next(frame_counter) % trace_every == 0 and logger.isEnabledFor(logging.INFO):
+        return logging.INFO
+    if logger.isEnabledFor(logging.DEBUG):
+        return logging.DEBUG
+    return None
+
+
+# ========================================
+# Metrics: per-stage latency histograms, counters and on-demand profiling
+# ========================================
+profiler_enabled = os.environ.get("SILA_PROFILER", "0") != "0"  # Allow POST /debug/profile captures
+profile_max_seconds = float(os.environ.get("SILA_PROFILE_MAX_SECONDS", "60"))  # Longest capture one call may ask for
+METRIC_STAGES = ("read", "decode", "preprocess", "infer", "calibrate", "fallback", "stabilize", "total")
+METRIC_BUCKETS_MS = (0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)  # Histogram upper bounds
+METRIC_COUNTERS = {
+    "frames": ("sila_frames_total", "Frames run through recognition"),
+    "fallback_sweeps": ("sila_fallback_sweeps_total", "Frames that retried every alternative normalization"),
+    "unknown": ("sila_unknown_predictions_total", "Responses that showed the unknown label"),
+    "placeholder": ("sila_placeholder_predictions_total", "Random placeholder letters served without a model"),
+    "cache_hits": ("sila_frame_cache_hits_total", "Frames answered from the motion-gated cache"),
+    "cache_misses": ("sila_frame_cache_misses_total", "Frames that missed the motion-gated cache"),
+    "shed": ("sila_frames_shed_total", "Frames refused by admission control"),
+    "errors": ("sila_inference_errors_total", "Frames whose inference raised"),
+}
+
+
+class StageTimer:
+    """Lap timer for one request: each lap() charges the time since the previous lap to a stage"""
+
+    __slots__ = ("started", "last", "stages")
+
+    def __init__(self):
+        self.started = self.last = time.perf_counter()
+        self.stages = {}
+
+    def lap(self, stage):
+        now = time.perf_counter()
+        self.stages[stage] = self.stages.get(stage, 0.0) + (now - self.last) * 1000
+        self.last = now
+
+    def finish(self):
+        """Record the request's total time; returns the stages in milliseconds"""
+        self.stages["total"] = (time.perf_counter() - self.started) * 1000
+        return self.stages
+
+    def server_timing(self):
+        """Server-Timing header value, e.g. 'decode;dur=1.20, infer;dur=3.40, total;dur=5.10'"""
+        return ", ".join(f"{stage};dur={ms:.2f}" for stage, ms in self.stages.items())
+
+
+class Metrics:
+    """Stage latency histograms and event counters, exported in Prometheus text format.
+
+    Everything lives in one float64 row per worker process: for every stage
+    the per-bucket counts (plus +Inf), sum and count, then the counters. A
+    single process keeps its row in ordinary memory; serve() creates a
+    shared-memory table before forking, so a scrape answered by any worker
+    reports the whole server. Each worker only writes its own row, so no lock
+    is taken; a scrape racing a write may be one frame behind.
+    """
+
+    def __init__(self, workers=1):
+        self._stage_width = len(METRIC_BUCKETS_MS) + 3
+        self._stage_index = {stage: i for i, stage in enumerate(METRIC_STAGES)}
+        self._counter_index = {name: i for i, name in enumerate(METRIC_COUNTERS)}
+        width = len(METRIC_STAGES) * self._stage_width + len(METRIC_COUNTERS)
+        self._shm = None
+        if workers > 1:
+            self._shm = shared_memory.SharedMemory(create=True, size=8 * workers * width)
+            self.table = np.ndarray((workers, width), dtype=np.float64, buffer=self._shm.buf)
+            self.table.fill(0)
+            self._owner = os.getpid()
+            atexit.register(self.close)
+        else:
+            self.table = np.zeros((1, width))
+        self.select_worker(0)
+
+    def select_worker(self, index):
+        """Write to row `index` from now on (called in each forked worker)"""
+        row = self.table[index]
+        split = len(METRIC_STAGES) * self._stage_width
+        self._histograms = row[:split].reshape(len(METRIC_STAGES), self._stage_width)
+        self._counters = row[split:]
+
+    def observe(self, stage, ms):
+        histogram = self._histograms[self._stage_index[stage]]
+        histogram[bisect.bisect_left(METRIC_BUCKETS_MS, ms)] += 1
+        histogram[-2] += ms
+        histogram[-1] += 1
+
+    def observe_stages(self, stages):
+        for stage, ms in stages.items():
+            self.observe(stage, ms)
+
+    def count(self, name, n=1):
+        self._counters[self._counter_index[name]] += n
+
+    def total(self, name):
+        """Server-wide value of a counter"""
+        return int(self.table[:, len(METRIC_STAGES) * self._stage_width + self._counter_index[name]].sum())
+
+    def render(self):
+        totals = self.table.sum(axis=0)
+        split = len(METRIC_STAGES) * self._stage_width
+        histograms = totals[:split].reshape(len(METRIC_STAGES), self._stage_width)
+        lines = ["# HELP sila_stage_duration_seconds Time spent in each recognition stage",
+                 "# TYPE sila_stage_duration_seconds histogram"]
+        bounds = [f"{ms / 1000:g}" for ms in METRIC_BUCKETS_MS] + ["+Inf"]
+        for stage, histogram in zip(METRIC_STAGES, histograms):
+            for le, n in zip(bounds, np.cumsum(histogram[:-2])):
+                lines.append(f'sila_stage_duration_seconds_bucket{{stage="{stage}",le="{le}"}} {n:.0f}')
+            lines.append(f'sila_stage_duration_seconds_sum{{stage="{stage}"}} {histogram[-2] / 1000:.6f}')
+            lines.append(f'sila_stage_duration_seconds_count{{stage="{stage}"}} {histogram[-1]:.0f}')
+        for (metric, description), value in zip(METRIC_COUNTERS.values(), totals[split:]):
+            lines += [f"# HELP {metric} {description}", f"# TYPE {metric} counter", f"{metric} {value:.0f}"]
+        return "\n".join(lines) + "\n"
+
+    def close(self):
+        if self._shm is None:
+            return
+        del self.table, self._histograms, self._counters
+        self._shm.close()
+        if os.getpid() == self._owner:
+            self._shm.unlink()
+        self._shm = None
+
+
+metrics = Metrics()
+
+
+class ProfilerBusy(Exception):
+    """Raised when a profile capture is already running"""
+
+
+class SamplingProfiler:
+    """Samples every thread's Python stack at a fixed interval for a bounded time.
+
+    The result is in collapsed-stack format ('thread;outer;...;inner count' per
+    distinct stack), which flamegraph.pl and speedscope read directly. Nothing
+    runs between captures, and only one capture runs at a time.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+
+    def capture(self, seconds, interval_s):
+        if not self._lock.acquire(blocking=False):
+            raise ProfilerBusy()
+        try:
+            own = threading.get_ident()
+            stacks = collections.Counter()
+            deadline = time.monotonic() + seconds
+            while time.monotonic() < deadline:
+                names = {thread.ident: thread.name for thread in threading.enumerate()}
+                for thread_id, frame in sys._current_frames().items():
+                    if thread_id == own:
+                        continue
+                    stack = []
+                    while frame is not None:
+                        code = frame.f_code
+                        stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                        frame = frame.f_back
+                    stack.append(names.get(thread_id, str(thread_id)))
+                    stacks[";".join(reversed(stack))] += 1
+                time.sleep(interval_s)
+            return stacks
+        finally:
+            self._lock.release()
+
+
+profiler = SamplingProfiler()
+
+
+# Global variables
+model_path = os.environ.get("SILA_MODEL_PATH", "assets/model.onnx")
+session = None
+
+# Stability system to prevent rapid letter changes
+stability_threshold = 3  # Need 3 consistent predictions to change
+min_confidence_threshold = 0.1  # Minimum confidence for any prediction (lowered for better results)
+
+# Prediction smoothing system
+buffer_size = 5  # Keep last 5 predictions for smoothing
+history_size = 10  # Keep last 10 predictions for stability/debug info
+num_classes = 32  # Number of letters the model can output
+
+# Per-client session state
+SESSION_HEADER = "x-session-id"
+SESSION_COOKIE = "sila_session"
+max_sessions = int(os.environ.get("SILA_MAX_SESSIONS", "1024"))  # Memory cap: ~1KB of state per session plus the frame cache
+session_idle_ttl = float(os.environ.get("SILA_SESSION_TTL", "300"))  # Seconds before an idle session is dropped
+
+# Per-session normalization calibration
+calibration_enabled = os.environ.get("SILA_CALIBRATION", "1") != "0"
+calibration_frames = int(os.environ.get("SILA_CALIBRATION_FRAMES", "10"))  # Frames scored before picking a method
+calibration_ttl = float(os.environ.get("SILA_CALIBRATION_TTL", "600"))  # Seconds a chosen method stays cached
+recalibrate_every = int(os.environ.get("SILA_RECALIBRATE_EVERY", "0"))  # Frames between recalibrations (0 = TTL only)
+# Alternative normalizations tried on low-confidence frames, in batch order
+FALLBACK_METHODS = ("Standard [0,1]", "Z-score", "Min-max [-1,1]", "ImageNet [-1,1]", "Enhanced [-1,1]", "Robust [0,1]")
+
+# Motion-gated inference cache
+dedup_threshold = float(os.environ.get("SILA_DEDUP_THRESHOLD", "2.0"))  # Mean gray-level change that counts as motion (0 = off)
+dedup_cache_size = int(os.environ.get("SILA_DEDUP_CACHE_SIZE", "2"))  # Recent 64x64 frames kept per session (4KB each)
+
+# Hand region of interest: crop to the hand before resizing to the model input
+roi_enabled = os.environ.get("SILA_ROI", "0") != "0"
+roi_mask = os.environ.get("SILA_ROI_MASK", "both")  # skin | motion | both
+roi_analysis_size = int(os.environ.get("SILA_ROI_ANALYSIS_SIZE", "96"))  # Draft decode target used to find the hand
+roi_margin = float(os.environ.get("SILA_ROI_MARGIN", "0.25"))  # Padding on each side, as a fraction of the box side
+roi_motion_threshold = int(os.environ.get("SILA_ROI_MOTION_THRESHOLD", "20"))  # Gray-level change that marks a pixel as moving
+roi_min_fraction = float(os.environ.get("SILA_ROI_MIN_FRACTION", "0.01"))  # Share of pixels a mask needs to move the box
+
+# Letter-to-word decoding
+decoder_enabled = os.environ.get("SILA_DECODER", "1") != "0"
+lexicon_path = os.environ.get("SILA_LEXICON_PATH", "assets/lexicon.txt")
+decoder_beam_width = int(os.environ.get("SILA_DECODER_BEAM", "8"))  # Lexicon prefixes kept per session
+decoder_candidates = int(os.environ.get("SILA_DECODER_CANDIDATES", "3"))  # Top model classes tried at each letter
+decoder_oov_penalty = float(os.environ.get("SILA_DECODER_OOV_PENALTY", "-2.0"))  # Log penalty per letter outside the lexicon
+# Boundaries are counted in frames, since the pacing hints stretch the time between frames
+letter_gap_frames = int(os.environ.get("SILA_LETTER_GAP_FRAMES", "4"))  # Frames without a stable letter before a held one counts again
+word_gap_frames = int(os.environ.get("SILA_WORD_GAP_FRAMES", "8"))  # Frames without a stable letter that end a word
+committed_words_kept = 10  # Committed words echoed back per session
+
+
+class PredictionStabilizer:
+    """Smoothing and stability state for a single client session.
+
+    All buffers are preallocated rings, and the per-class confidence sums are
+    updated incrementally, so each frame costs O(1) and allocates nothing.
+    """
+
+    __slots__ = (
+        "buffer_classes", "buffer_confidences", "buffer_pos", "buffer_count",
+        "class_sums", "class_counts",
+        "history_classes", "history_pos", "history_count",
+        "run_class", "run_length", "last_stable_prediction",
+    )
+
+    def __init__(self):
+        self.buffer_classes = [0] * buffer_size
+        self.buffer_confidences = [0.0] * buffer_size
+        self.buffer_pos = 0
+        self.buffer_count = 0
+        self.class_sums = [0.0] * num_classes
+        self.class_counts = [0] * num_classes
+        self.history_classes = [0] * history_size
+        self.history_pos = 0
+        self.history_count = 0
+        self.run_class = None
+        self.run_length = 0
+        self.last_stable_prediction = None
+
+    def smooth(self, predicted_class, confidence):
+        """Apply smoothing to reduce prediction noise"""
+        predicted_class = int(predicted_class)
+        confidence = float(confidence)
+        if not 0 <= predicted_class < num_classes:
+            # Outside the fixed-size sums (a model with more outputs); pass through unsmoothed
+            return predicted_class, confidence
+
+        # Evict the oldest entry from the running sums once the ring is full
+        pos = self.buffer_pos
+        if self.buffer_count == buffer_size:
+            old_class = self.buffer_classes[pos]
+            self.class_counts[old_class] -= 1
+            if self.class_counts[old_class] == 0:
+                self.class_sums[old_class] = 0.0  # Reset to avoid float drift
+            else:
+                self.class_sums[old_class] -= self.buffer_confidences[pos]
+        else:
+            self.buffer_count += 1
+
+        self.buffer_classes[pos] = predicted_class
+        self.buffer_confidences[pos] = confidence
+        self.class_sums[predicted_class] += confidence
+        self.class_counts[predicted_class] += 1
+        self.buffer_pos = (pos + 1) % buffer_size
+
+        # If buffer is not full, return current prediction
+        if self.buffer_count < buffer_size:
+            return predicted_class, confidence
+
+        # Find the class with highest weighted confidence
+        sums = self.class_sums
+        best_class = max(range(num_classes), key=sums.__getitem__)
+        best_confidence = sums[best_class]
+
+        # Only use smoothed prediction if it's significantly better
+        if best_confidence > 0 and best_confidence > confidence * 1.2:  # 20% improvement threshold
+            return best_class, best_confidence
+
+        return predicted_class, confidence
+
+    def is_stable(self, predicted_class, confidence):
+        """Check if prediction is stable enough to be displayed"""
+        predicted_class = int(predicted_class)
+
+        # Add current prediction to history
+        self.history_classes[self.history_pos] = predicted_class
+        self.history_pos = (self.history_pos + 1) % history_size
+        if self.history_count < history_size:
+            self.history_count += 1
+
+        # Track how many consecutive predictions agree instead of rescanning history
+        if predicted_class == self.run_class:
+            self.run_length += 1
+        else:
+            self.run_class = predicted_class
+            self.run_length = 1
+
+        # Additional stability check: confidence should be above threshold
+        if confidence < min_confidence_threshold:
+            return False
+
+        # Last N predictions are the same class: update (or maintain) the stable prediction
+        if self.run_length >= stability_threshold:
+            self.last_stable_prediction = predicted_class
+            return True
+
+        return False
+
+    def recent_classes(self, n=5):
+        """Return the last n predicted classes, oldest first"""
+        n = min(n, self.history_count)
+        return [self.history_classes[(self.history_pos - n + i) % history_size] for i in range(n)]
+
+    def to_record(self, record):
+        """Copy this state into a STABILIZER_DTYPE record (None is stored as -1)"""
+        record["buffer_classes"] = self.buffer_classes
+        record["buffer_confidences"] = self.buffer_confidences
+        record["buffer_pos"] = self.buffer_pos
+        record["buffer_count"] = self.buffer_count
+        record["class_sums"] = self.class_sums
+        record["class_counts"] = self.class_counts
+        record["history_classes"] = self.history_classes
+        record["history_pos"] = self.history_pos
+        record["history_count"] = self.history_count
+        record["run_class"] = -1 if self.run_class is None else self.run_class
+        record["run_length"] = self.run_length
+        record["last_stable_prediction"] = -1 if self.last_stable_prediction is None else self.last_stable_prediction
+
+    def from_record(self, record):
+        """Replace this state with the contents of a STABILIZER_DTYPE record"""
+        self.buffer_classes = record["buffer_classes"].tolist()
+        self.buffer_confidences = record["buffer_confidences"].tolist()
+        self.buffer_pos = int(record["buffer_pos"])
+        self.buffer_count = int(record["buffer_count"])
+        self.class_sums = record["class_sums"].tolist()
+        self.class_counts = record["class_counts"].tolist()
+        self.history_classes = record["history_classes"].tolist()
+        self.history_pos = int(record["history_pos"])
+        self.history_count = int(record["history_count"])
+        run_class = int(record["run_class"])
+        self.run_class = None if run_class < 0 else run_class
+        self.run_length = int(record["run_length"])
+        last_stable = int(record["last_stable_prediction"])
+        self.last_stable_prediction = None if last_stable < 0 else last_stable
+
+
+DECODER_STATE_BYTES = 2048  # Room for the word decoder's beam and committed words in a shared record
+STABILIZER_DTYPE = np.dtype([
+    ("key", np.uint64),
+    ("last_seen", np.float64),
+    ("buffer_classes", np.int32, (buffer_size,)),
+    ("buffer_confidences", np.float64, (buffer_size,)),
+    ("buffer_pos", np.int32),
+    ("buffer_count", np.int32),
+    ("class_sums", np.float64, (num_classes,)),
+    ("class_counts", np.int32, (num_classes,)),
+    ("history_classes", np.int32, (history_size,)),
+    ("history_pos", np.int32),
+    ("history_count", np.int32),
+    ("run_class", np.int32),
+    ("run_length", np.int32),
+    ("last_stable_prediction", np.int32),
+    ("decoder", f"S{DECODER_STATE_BYTES}"),  # WordDecoder.to_bytes(); empty for a new session
+    ("calibration_scores", np.float64, (len(FALLBACK_METHODS),)),
+    ("calibration_frames_seen", np.int32),
+    ("calibration_method", np.int32),  # Index into FALLBACK_METHODS, -1 while calibrating
+    ("calibration_expires_at", np.float64),  # time.monotonic(), which is system-wide
+    ("calibration_frames_since", np.int32),
+])
+
+
+class NormalizationCalibration:
+    """Learns which input normalization works best for one client's camera.
+
+    For the first calibration_frames frames every candidate normalization is
+    scored in one batched call. The method with the highest mean confidence
+    is then cached for calibration_ttl seconds (or recalibrate_every frames),
+    and steady-state frames run only that transform.
+    """
+
+    __slots__ = ("scores", "frames_seen", "method", "expires_at", "frames_since_calibrated")
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.scores = np.zeros(len(FALLBACK_METHODS), dtype=np.float64)
+        self.frames_seen = 0
+        self.method = None
+        self.expires_at = 0.0
+        self.frames_since_calibrated = 0
+
+    def to_record(self, record):
+        """Copy this state into a STABILIZER_DTYPE record"""
+        record["calibration_scores"] = self.scores
+        record["calibration_frames_seen"] = self.frames_seen
+        record["calibration_method"] = -1 if self.method is None else FALLBACK_METHODS.index(self.method)
+        record["calibration_expires_at"] = self.expires_at
+        record["calibration_frames_since"] = self.frames_since_calibrated
+
+    def from_record(self, record):
+        """Replace this state with the contents of a STABILIZER_DTYPE record"""
+        self.scores = record["calibration_scores"].copy()
+        self.frames_seen = int(record["calibration_frames_seen"])
+        method = int(record["calibration_method"])
+        self.method = None if method < 0 else FALLBACK_METHODS[method]
+        self.expires_at = float(record["calibration_expires_at"])
+        self.frames_since_calibrated = int(record["calibration_frames_since"])
+
+    def expired(self, now):
+        return now >= self.expires_at or (recalibrate_every and self.frames_since_calibrated >= recalibrate_every)
+
+    def current_method(self, now):
+        """Return the cached normalization, or None while (re)calibrating; counts one frame against it"""
+        if self.method is None:
+            return None
+        if self.expired(now):
+            self.reset()
+            return None
+        self.frames_since_calibrated += 1
+        return self.method
+
+    def peek_method(self, now):
+        """The cached normalization current_method would return, without counting a frame or resetting"""
+        return None if self.method is None or self.expired(now) else self.method
+
+    def observe(self, confidences, now):
+        """Add one frame's per-method confidences; settles on a method after enough frames"""
+        self.scores += confidences
+        self.frames_seen += 1
+        if self.frames_seen >= calibration_frames:
+            self.method = FALLBACK_METHODS[int(np.argmax(self.scores))]
+            self.expires_at = now + calibration_ttl
+            self.frames_since_calibrated = 0
+            logger.info("🎛️  Calibrated normalization: %s (mean confidence %.4f over %d frames)",
+                        self.method, self.scores.max() / self.frames_seen, self.frames_seen)
+
+
+def frame_difference(a, b):
+    """Mean absolute difference between two uint8 frames, in gray levels"""
+    return float(np.abs(a.astype(np.int16) - b).mean())
+
+
+class FrameCache:
+    """The last few inferred 64x64 frames of one session and their model outputs.
+
+    A new frame whose mean absolute difference from a cached frame is below
+    dedup_threshold reuses that frame's prediction, so a held pose skips
+    session.run and the fallback sweep. Entries are compared against the frame
+    that was actually inferred, so slow drift can't accumulate unnoticed.
+    """
+
+    __slots__ = ("entries", "hits", "misses")
+
+    def __init__(self):
+        self.entries = []  # (gray, prediction, preprocessing_method), most recent first
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, gray):
+        """Return (prediction, preprocessing_method) for a matching frame, or None"""
+        for i, entry in enumerate(self.entries):
+            if frame_difference(gray, entry[0]) < dedup_threshold:
+                if i:
+                    self.entries.insert(0, self.entries.pop(i))
+                self.hits += 1
+                metrics.count("cache_hits")
+                return entry[1], entry[2]
+        self.misses += 1
+        metrics.count("cache_misses")
+        return None
+
+    def store(self, gray, prediction, preprocessing_method):
+        """Remember the model output for a frame (replacing it if already stored)"""
+        entry = (gray, prediction.copy(), preprocessing_method)
+        if self.entries and self.entries[0][0] is gray:
+            self.entries[0] = entry
+            return
+        self.entries.insert(0, entry)
+        del self.entries[dedup_cache_size:]
+
+
+def skin_mask(ycbcr):
+    """Skin-tone pixels of a YCbCr frame, using the usual fixed Cb/Cr chroma box"""
+    cb = ycbcr[..., 1]
+    cr = ycbcr[..., 2]
+    return (cb >= 77) & (cb <= 127) & (cr >= 133) & (cr <= 173)
+
+
+def mask_box(mask, min_count):
+    """(top, bottom, left, right) of the rows and columns holding at least two mask pixels, or None"""
+    if np.count_nonzero(mask) < min_count:
+        return None
+    rows = np.flatnonzero(np.count_nonzero(mask, axis=1) >= 2)
+    cols = np.flatnonzero(np.count_nonzero(mask, axis=0) >= 2)
+    if rows.size == 0 or cols.size == 0:
+        return None
+    return int(rows[0]), int(rows[-1]) + 1, int(cols[0]), int(cols[-1]) + 1
+
+
+def square_box(box, height, width):
+    """Pad box by roi_margin and square it (the model input is square), kept inside the frame"""
+    top, bottom, left, right = box
+    side = max(bottom - top, right - left) * (1 + 2 * roi_margin)
+    side = int(min(max(side, min(height, width) / 4), height, width))
+    y = min(max((top + bottom - side) / 2, 0), height - side)
+    x = min(max((left + right - side) / 2, 0), width - side)
+    y, x = int(round(y)), int(round(x))
+    return y, y + side, x, x + side
+
+
+class HandTracker:
+    """Where the hand is in one session's frames.
+
+    The box is only recomputed when enough pixels changed since the frame it
+    was found on; otherwise the previous box is reused without building a
+    mask. With the "both" mask, the moving skin pixels are preferred, so a
+    still face doesn't pull the crop away from the signing hand.
+    """
+
+    __slots__ = ("reference", "box", "frame_shape")
+
+    def __init__(self):
+        self.reference = None  # Luma of the frame the current box was computed on
+        self.box = None
+        self.frame_shape = None
+
+    def locate(self, ycbcr):
+        """Return the (top, bottom, left, right) crop for this frame, or None for the whole frame"""
+        luma = ycbcr[..., 0]
+        height, width = luma.shape
+        min_count = roi_min_fraction * height * width
+        moving = None
+        if self.reference is not None and self.reference.shape == luma.shape:
+            moving = np.abs(luma.astype(np.int16) - self.reference) > roi_motion_threshold
+            if self.box is not None and np.count_nonzero(moving) < min_count:
+                return self.box
+
+        if roi_mask == "motion":
+            box = mask_box(moving, min_count) if moving is not None else None
+        else:
+            skin = skin_mask(ycbcr)
+            box = mask_box(skin & moving, min_count) if roi_mask == "both" and moving is not None else None
+            if box is None:
+                box = mask_box(skin, min_count)
+
+        self.reference = luma.copy()
+        self.frame_shape = (height, width)
+        if box is not None:
+            self.box = square_box(box, height, width)
+        return self.box
+
+    def normalized_box(self):
+        """The current crop as [x0, y0, x1, y1] fractions of the frame, or None"""
+        if self.box is None:
+            return None
+        height, width = self.frame_shape
+        top, bottom, left, right = self.box
+        return [round(left / width, 3), round(top / height, 3), round(right / width, 3), round(bottom / height, 3)]
+
+
+ARABIC_NORMALIZATION = str.maketrans({
+    "أ": "ا", "إ": "ا", "آ": "ا", "ئ": "ي", "ؤ": "و", "ء": None, "ة": "ت", "ى": "ي", "ـ": None,
+    **{chr(mark): None for mark in range(0x064B, 0x0653)},  # Diacritics
+})
+
+
+def normalize_letters(text):
+    """Fold the spelling variants the sign alphabet doesn't distinguish"""
+    return text.translate(ARABIC_NORMALIZATION)
+
+
+class LexiconTrie:
+    """A word list as a character trie stored in flat per-node lists.
+
+    Each node also records the most likely word below it, so the decoder can
+    rank a prefix by its best completion and suggest it without searching.
+    """
+
+    def __init__(self, words):
+        """words: (word, count) pairs"""
+        words = [(word, count) for word, count in words if word]
+        total = float(sum(count for _, count in words)) or 1.0
+        self.children = [{}]
+        self.word = [None]  # Display form of the word ending at each node
+        self.word_score = [None]  # Log prior of that word
+        self.best_score = [-float("inf")]
+        self.best_word = [None]
+        for word, count in words:
+            score = math.log(count / total)
+            node = 0
+            path = [0]
+            for char in normalize_letters(word):
+                child = self.children[node].get(char)
+                if child is None:
+                    child = len(self.children)
+                    self.children[node][char] = child
+                    self.children.append({})
+                    self.word.append(None)
+                    self.word_score.append(None)
+                    self.best_score.append(-float("inf"))
+                    self.best_word.append(None)
+                node = child
+                path.append(node)
+            if self.word_score[node] is None or score > self.word_score[node]:
+                self.word[node] = word
+                self.word_score[node] = score
+            for visited in path:
+                if score > self.best_score[visited]:
+                    self.best_score[visited] = score
+                    self.best_word[visited] = word
+
+    def step(self, node, chars):
+        """The node reached from node by chars, or None if no word continues that way"""
+        for char in chars:
+            node = self.children[node].get(char)
+            if node is None:
+                return None
+        return node
+
+
+def load_lexicon(path):
+    """LexiconTrie from a word list (word[<tab>count] per line), or None if there is none"""
+    if not os.path.exists(path):
+        logger.warning("⚠️  Lexicon not found at %s, word decoding disabled", path)
+        return None
+    words = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            word, _, count = line.partition("\t")
+            words.append((word.strip(), float(count) if count.strip() else None))
+    # Without counts, the file order is the prior (Zipf by rank)
+    words = [(word, count if count is not None else 1.0 / (rank + 1)) for rank, (word, count) in enumerate(words)]
+    trie = LexiconTrie(words)
+    logger.info("📖 Loaded %d lexicon words (%d trie nodes) from %s", len(words), len(trie.children), path)
+    return trie
+
+
+lexicon = load_lexicon(lexicon_path) if decoder_enabled else None
+
+
+class WordDecoder:
+    """Turns one session's stabilized letter stream into words.
+
+    A new letter starts when the stable class changes, or when the same class
+    comes back after letter_gap_frames frames without a stable letter;
+    word_gap_frames such frames in a row commit the word. Gaps are counted in
+    frames rather than time, so a slow capture interval can't repeat a held
+    letter. At each letter the model's top candidates extend
+    a beam of lexicon prefixes (O(beam x candidates)), alongside one
+    out-of-vocabulary hypothesis that spells the letters as recognized; the
+    other frames cost O(1), so the cost never grows with the session.
+    """
+
+    __slots__ = ("beam", "oov", "letters", "committed", "words_committed", "last_class", "gap_frames")
+
+    def __init__(self):
+        self.committed = collections.deque(maxlen=committed_words_kept)
+        self.words_committed = 0
+        self.last_class = None
+        self.gap_frames = 0
+        self.reset()
+
+    def reset(self):
+        self.beam = [(0.0, 0, "")]  # (log score, trie node, letters so far)
+        self.oov = (0.0, "")
+        self.letters = 0
+
+    def observe(self, stable_class, prediction):
+        """Feed one frame: its stable class (None if unstable or unknown) and the model output row"""
+        if stable_class is None:
+            self.gap_frames += 1
+            if self.letters and self.gap_frames >= word_gap_frames:
+                self.commit()
+            return
+        new_letter = stable_class != self.last_class or self.gap_frames >= letter_gap_frames
+        self.last_class = stable_class
+        self.gap_frames = 0
+        if new_letter:
+            self.extend(stable_class, prediction)
+
+    def extend(self, stable_class, prediction):
+        candidates = top_predictions(prediction, decoder_candidates)
+        if all(cls != stable_class for cls, _, _ in candidates):
+            # The smoothed class can differ from this frame's argmax; it always leads
+            candidates = [(stable_class, label_for(stable_class), candidates[0][2])] + candidates[:-1]
+        else:
+            candidates.sort(key=lambda candidate: candidate[0] != stable_class)
+        total = sum(p for _, _, p in candidates) or 1.0
+        scored = [(normalize_letters(label), math.log(max(p / total, 1e-6))) for _, label, p in candidates]
+
+        extended = {}
+        for score, node, text in self.beam:
+            for chars, log_p in scored:
+                child = lexicon.step(node, chars)
+                if child is not None and (child not in extended or extended[child][0] < score + log_p):
+                    extended[child] = (score + log_p, child, text + chars)
+        # Rank prefixes by their best completion so common words survive the pruning
+        self.beam = sorted(extended.values(), key=lambda h: h[0] + lexicon.best_score[h[1]], reverse=True)[:decoder_beam_width]
+        chars, log_p = scored[0]
+        self.oov = (self.oov[0] + log_p + decoder_oov_penalty, self.oov[1] + chars)
+        self.letters += 1
+
+    def best_word(self):
+        """The word the letters so far decode to: the best complete lexicon word, or the letters as spelled"""
+        score, word = self.oov
+        for hyp_score, node, _ in self.beam:
+            word_score = lexicon.word_score[node]
+            if word_score is not None and hyp_score + word_score > score:
+                score, word = hyp_score + word_score, lexicon.word[node]
+        return word
+
+    def commit(self):
+        """Finalize the current word, if any"""
+        if self.letters:
+            self.committed.append(self.best_word())
+            self.words_committed += 1
+        self.reset()
+
+    def to_bytes(self, limit=DECODER_STATE_BYTES):
+        """This state as compact JSON for the shared session table, dropping the oldest committed words to fit"""
+        committed = list(self.committed)
+        while True:
+            data = json.dumps([self.beam, self.oov, self.letters, committed, self.words_committed,
+                               self.last_class, self.gap_frames], ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            if len(data) <= limit or not committed:
+                return data if len(data) <= limit else b""
+            committed.pop(0)
+
+    def from_bytes(self, data):
+        """Replace this state with one written by to_bytes (empty: a fresh decoder)"""
+        if not data:
+            self.__init__()
+            return
+        beam, oov, letters, committed, words_committed, last_class, gap_frames = json.loads(data)
+        self.beam = [tuple(hypothesis) for hypothesis in beam]
+        self.oov = tuple(oov)
+        self.letters = letters
+        self.committed = collections.deque(committed, maxlen=committed_words_kept)
+        self.words_committed = words_committed
+        self.last_class = last_class
+        self.gap_frames = gap_frames
+
+    def state(self):
+        """{"partial", "completion", "committed"} for the response, or None while there is nothing to show.
+
+        partial is the letters as stabilized, so it never shows a letter the
+        model didn't predict; the lexicon prior only picks the completion.
+        """
+        partial = completion = None
+        if self.letters:
+            partial = self.oov[1]
+            if self.beam:
+                completion = lexicon.best_word[self.beam[0][1]]
+        if not (partial or completion or self.committed):
+            return None
+        return {"partial": partial, "completion": completion, "committed": list(self.committed)}
+
+
+class ClientSession:
+    """Everything the server remembers about one client feed"""
+
+    __slots__ = ("stabilizer", "calibration", "frame_cache", "hand_tracker", "word_decoder", "model_version", "last_seen")
+
+    def __init__(self):
+        self.stabilizer = PredictionStabilizer()
+        self.calibration = NormalizationCalibration()
+        self.frame_cache = FrameCache()
+        self.hand_tracker = HandTracker()
+        self.word_decoder = WordDecoder() if lexicon is not None else None
+        self.model_version = None  # Version the frame cache and calibration were built with
+        self.last_seen = time.monotonic()
+
+
+class SessionStore:
+    """LRU map of session id -> ClientSession with a hard size cap"""
+
+    def __init__(self, max_size=max_sessions, idle_ttl=session_idle_ttl):
+        self.max_size = max_size
+        self.idle_ttl = idle_ttl
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, session_id):
+        """Return the state for a session, creating it if needed"""
+        now = time.monotonic()
+        with self._lock:
+            client = self._sessions.get(session_id)
+            if client is None:
+                client = ClientSession()
+                self._sessions[session_id] = client
+                self._evict(now)
+            else:
+                self._sessions.move_to_end(session_id)
+            client.last_seen = now
+            return client
+
+    def _evict(self, now):
+        # Oldest entries are at the front; drop idle ones, then enforce the cap
+        sessions = self._sessions
+        while sessions:
+            oldest = next(iter(sessions.values()))
+            if len(sessions) > self.max_size or now - oldest.last_seen > self.idle_ttl:
+                sessions.popitem(last=False)
+            else:
+                break
+
+    def __len__(self):
+        return len(self._sessions)
+
+
+client_sessions = SessionStore()
+
+
+def get_session_id(request):
+    """Identify the client feed from the session header, cookie or client address"""
+    session_id = request.headers.get(SESSION_HEADER) or request.cookies.get(SESSION_COOKIE)
+    if session_id:
+        return session_id[:128]
+    if request.client is not None:
+        return request.client.host
+    return "anonymous"
+
+
+class SharedStabilizerTable:
+    """Per-session state that decides what a client sees, kept in shared memory across pre-forked workers.
+
+    Consecutive frames from one client can land on different worker processes,
+    so the smoothing, stability, word decoding and chosen normalization live in
+    a fixed-size open-addressed table created before fork. A request copies
+    its session's record in, runs, and copies it back. Only the frame cache
+    and hand tracker stay per worker: a cache miss reruns the same model on
+    the same frame, and the tracker re-locks onto the hand within a frame.
+    """
+
+    probe_limit = 16
+
+    def __init__(self, capacity=max_sessions):
+        self.capacity = max(1, capacity)
+        self._shm = shared_memory.SharedMemory(create=True, size=STABILIZER_DTYPE.itemsize * self.capacity)
+        self.table = np.ndarray((self.capacity,), dtype=STABILIZER_DTYPE, buffer=self._shm.buf)
+        self.table[:] = np.zeros((), dtype=STABILIZER_DTYPE)  # fill(0) would store b"0" in the decoder field
+        self._lock = multiprocessing.Lock()
+        self._owner = os.getpid()
+        atexit.register(self.close)
+
+    @staticmethod
+    def session_key(session_id):
+        key = int.from_bytes(hashlib.blake2b(session_id.encode("utf-8"), digest_size=8).digest(), "little")
+        return key or 1  # 0 marks a free slot
+
+    def _slot(self, key, now):
+        """Index of the record for key, claiming a free, idle or oldest slot if it has none"""
+        keys = self.table["key"]
+        last_seen = self.table["last_seen"]
+        start = key % self.capacity
+        window = [(start + probe) % self.capacity for probe in range(min(self.probe_limit, self.capacity))]
+        for index in window:
+            if keys[index] == key:
+                return index
+        index = min(window, key=lambda i: (keys[i] != 0 and now - last_seen[i] < session_idle_ttl, last_seen[i]))
+        self.table[index] = np.zeros((), dtype=STABILIZER_DTYPE)
+        self.table[index]["key"] = key
+        PredictionStabilizer().to_record(self.table[index])
+        self.table[index]["calibration_method"] = -1
+        return index
+
+    def load(self, session_id, client):
+        """Replace a ClientSession's worker-local state with the shared copy"""
+        now = time.time()
+        with self._lock:
+            record = self.table[self._slot(self.session_key(session_id), now)]
+            record["last_seen"] = now
+            client.stabilizer.from_record(record)
+            client.calibration.from_record(record)
+            if client.word_decoder is not None:
+                client.word_decoder.from_bytes(record["decoder"].item())
+
+    def save(self, session_id, client):
+        """Publish a ClientSession's worker-local state for the next worker to pick up"""
+        # Encoded outside the lock; monotonic timestamps in it are system-wide, so any worker can read them
+        decoder_state = client.word_decoder.to_bytes() if client.word_decoder is not None else b""
+        now = time.time()
+        with self._lock:
+            record = self.table[self._slot(self.session_key(session_id), now)]
+            record["last_seen"] = now
+            client.stabilizer.to_record(record)
+            client.calibration.to_record(record)
+            record["decoder"] = decoder_state
+
+    def close(self):
+        del self.table
+        self._shm.close()
+        if os.getpid() == self._owner:
+            self._shm.unlink()
+
+
+shared_stabilizers = None  # Set by serve() when running pre-forked workers
+
+def validate_model(model_session=None):
+    """Validate that the model (default: the serving session) is working correctly"""
+    if model_session is None:
+        model_session = session
+    try:
+        logger.info("🔍 Validating model...")
+        
+        # Create a test image (simple pattern)
+        test_img = np.random.randint(0, 255, (64, 64), dtype=np.uint8)
+        test_img = Image.fromarray(test_img)
+        
+        # Test basic preprocessing (avoid calling the complex function)
+        img_array = np.array(test_img.convert("L").resize((64, 64)), dtype=np.float32)
+        img_array = (img_array / 255.0 - 0.5) / 0.5  # Simple normalization
+        img_array = np.expand_dims(np.expand_dims(img_array, axis=0), axis=0)
+        logger.debug("✅ Preprocessing test passed")
+        
+        # Test inference
+        input_name = model_session.get_inputs()[0].name
+        prediction = model_session.run(None, {input_name: img_array})[0]
+        
+        logger.info("✅ Inference test passed: input shape %s, output shape %s, output range [%.4f, %.4f]",
+                    img_array.shape, prediction.shape, np.min(prediction), np.max(prediction))
+        
+        # Test confidence calculation
+        confidence = np.max(prediction)
+        confidence_percent = (confidence / np.sum(np.abs(prediction))) * 100 if np.sum(np.abs(prediction)) > 0 else 0
+        logger.debug("Test confidence: %.4f (%.2f%%)", confidence, confidence_percent)
+        
+        return True
+        
+    except Exception as e:
+        logger.error("❌ Model validation failed: %s", e)
+        return False
+
+# ========================================
+# ONNX Runtime session configuration
+# ========================================
+ort_optimization_level = os.environ.get("SILA_ORT_OPT_LEVEL", "all")  # disabled | basic | extended | all
+ort_intra_op_threads = int(os.environ.get("SILA_ORT_INTRA_THREADS", "1"))  # Threads inside one operator
+ort_inter_op_threads = int(os.environ.get("SILA_ORT_INTER_THREADS", "1"))  # Threads across operators (parallel mode only)
+ort_execution_mode = os.environ.get("SILA_ORT_EXECUTION_MODE", "sequential")  # sequential | parallel
+session_pool_size = int(os.environ.get("SILA_SESSION_POOL_SIZE", str(max(1, (os.cpu_count() or 1) // max(1, ort_intra_op_threads)))))
+model_variant = os.environ.get("SILA_MODEL_VARIANT", "fp32")  # "int8" serves a dynamically quantized copy
+share_weights = os.environ.get("SILA_SHARE_WEIGHTS", "1") != "0"  # Map .onnx weights from one file for every session and worker (needs onnx)
+
+GRAPH_OPTIMIZATION_LEVELS = {
+    "disabled": ort.GraphOptimizationLevel.ORT_DISABLE_ALL,
+    "basic": ort.GraphOptimizationLevel.ORT_ENABLE_BASIC,
+    "extended": ort.GraphOptimizationLevel.ORT_ENABLE_EXTENDED,
+    "all": ort.GraphOptimizationLevel.ORT_ENABLE_ALL,
+}
+
+
+def make_session_options(initializers=()):
+    """SessionOptions built from the SILA_ORT_* settings, serving the given (name, OrtValue) initializers"""
+    options = ort.SessionOptions()
+    options.graph_optimization_level = GRAPH_OPTIMIZATION_LEVELS[ort_optimization_level]
+    options.intra_op_num_threads = ort_intra_op_threads
+    options.inter_op_num_threads = ort_inter_op_threads
+    options.execution_mode = (ort.ExecutionMode.ORT_PARALLEL if ort_execution_mode == "parallel"
+                              else ort.ExecutionMode.ORT_SEQUENTIAL)
+    if initializers:
+        # Kernels would otherwise repack the shared weights into a private copy per session
+        options.add_session_config_entry("session.disable_prepacking", "1")
+        for name, value in initializers:
+            options.add_initializer(name, value)
+    return options
+
+
+def quantized_model_path(path):
+    """Where the INT8 copy of a model lives: assets/model.onnx -> assets/model.int8.onnx"""
+    root, ext = os.path.splitext(path)
+    return f"{root}.int8{ext}"
+
+
+def ensure_quantized_model(path):
+    """Return the path of a dynamically quantized INT8 copy of path, creating it if stale"""
+    int8_path = quantized_model_path(path)
+    if not os.path.exists(int8_path) or os.path.getmtime(int8_path) < os.path.getmtime(path):
+        # Needs the optional onnx package
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+        logger.info("🔧 Quantizing %s -> %s (dynamic INT8)", path, int8_path)
+        quantize_dynamic(path, int8_path, weight_type=QuantType.QInt8)
+    return int8_path
+
+
+def shared_weights_paths(path):
+    """Where the split copy of a model lives: assets/model.onnx -> assets/model.shared.onnx + assets/model.shared.weights"""
+    root, ext = os.path.splitext(path)
+    return f"{root}.shared{ext}", f"{root}.shared.weights"
+
+
+def ensure_shared_weights(path):
+    """Return the path of a copy of path whose initializers live in one flat weights file, creating it if stale"""
+    graph_path, weights_path = shared_weights_paths(path)
+    if os.path.exists(graph_path) and os.path.getmtime(graph_path) >= os.path.getmtime(path):
+        return graph_path
+    # Needs the optional onnx package
+    import onnx
+    from onnx import numpy_helper
+    logger.info("🔧 Splitting the weights of %s -> %s", path, weights_path)
+    model = onnx.load(path)
+    # Write under temporary names so a worker never maps a half-written file
+    suffix = f".{os.getpid()}.tmp"
+    try:
+        with open(weights_path + suffix, "wb") as weights:
+            for tensor in model.graph.initializer:
+                data = numpy_helper.to_array(tensor)
+                if data.dtype == object:
+                    continue  # String tensors stay in the graph
+                weights.write(b"\0" * (-weights.tell() % 64))  # Keep every tensor 64-byte aligned
+                offset = weights.tell()
+                weights.write(np.ascontiguousarray(data).tobytes())
+                for field in ("raw_data", "float_data", "int32_data", "int64_data", "double_data", "uint64_data"):
+                    tensor.ClearField(field)
+                tensor.data_location = onnx.TensorProto.EXTERNAL
+                del tensor.external_data[:]
+                for key, value in (("location", os.path.basename(weights_path)), ("offset", str(offset)), ("length", str(data.nbytes))):
+                    entry = tensor.external_data.add()
+                    entry.key, entry.value = key, value
+        onnx.save(model, graph_path + suffix)
+        os.replace(weights_path + suffix, weights_path)
+        os.replace(graph_path + suffix, graph_path)
+    finally:
+        for leftover in (weights_path + suffix, graph_path + suffix):
+            if os.path.exists(leftover):
+                os.unlink(leftover)
+    return graph_path
+
+
+def shared_initializers(graph_path):
+    """(name, OrtValue) for each external initializer of graph_path, viewing its memory-mapped weights file"""
+    import onnx
+    from onnx.helper import tensor_dtype_to_np_dtype
+    model = onnx.load(graph_path, load_external_data=False)
+    weights = None
+    initializers = []
+    for tensor in model.graph.initializer:
+        if tensor.data_location != onnx.TensorProto.EXTERNAL:
+            continue
+        info = {entry.key: entry.value for entry in tensor.external_data}
+        if weights is None:
+            weights = np.memmap(os.path.join(os.path.dirname(graph_path), info["location"]), mode="r")
+        array = np.ndarray(tuple(tensor.dims), dtype=tensor_dtype_to_np_dtype(tensor.data_type),
+                           buffer=weights, offset=int(info.get("offset", 0)))
+        initializers.append((tensor.name, ort.OrtValue.ortvalue_from_numpy(array)))
+    return initializers
+
+
+def resolve_serving_path(path=None):
+    """The model file to serve for path (default: the newest version), or its INT8 copy when SILA_MODEL_VARIANT=int8"""
+    if path is None:
+        path = initial_model_path()
+    if model_variant == "int8":
+        try:
+            return ensure_quantized_model(path)
+        except Exception as e:
+            logger.warning("⚠️  INT8 quantization unavailable (%s), serving FP32", e)
+    return path
+
+
+class SessionPool:
+    """Identical inference sessions so concurrent runs never queue on one session.
+
+    With SILA_SHARE_WEIGHTS, an .onnx model's initializers are split into a
+    flat weights file that is memory-mapped read-only and handed to every
+    session through SessionOptions.add_initializer, so all sessions, and all
+    pre-forked workers through the page cache, read one copy of the weights.
+    Weight prepacking is turned off for that, since it would copy them again.
+    .ort models, or a missing onnx package, fall back to a copy per session.
+    """
+
+    def __init__(self, path, size=session_pool_size):
+        self.path = path
+        self.initializers = []  # Keeps the mapped weights alive for as long as the sessions
+        graph_path = path
+        if share_weights and path.endswith(".onnx"):
+            try:
+                graph_path = ensure_shared_weights(path)
+                self.initializers = shared_initializers(graph_path)
+            except Exception as e:
+                logger.warning("⚠️  Weight sharing unavailable (%s), every session loads its own copy", e)
+                graph_path = path
+        self.sessions = [ort.InferenceSession(graph_path, sess_options=make_session_options(self.initializers))
+                         for _ in range(max(1, size))]
+        model_input = self.sessions[0].get_inputs()[0]
+        self.input_name = model_input.name
+        self.input_shape = model_input.shape
+        self._free = queue.SimpleQueue()
+        for pooled in self.sessions:
+            self._free.put(pooled)
+
+    def run(self, batch):
+        """Run a [n, 1, 64, 64] batch on whichever session is free; returns the first output"""
+        pooled = self._free.get()
+        try:
+            return pooled.run(None, {self.input_name: batch})[0]
+        finally:
+            self._free.put(pooled)
+
+    def warm_up(self, batch_sizes=(1,)):
+        """Run every session once per batch size so first requests don't pay for allocations"""
+        start = time.perf_counter()
+        fixed = self.input_shape[0] if isinstance(self.input_shape[0], int) and self.input_shape[0] > 0 else None
+        for pooled in self.sessions:
+            for n in batch_sizes:
+                if fixed is not None and n != fixed:
+                    continue
+                pooled.run(None, {self.input_name: np.zeros((n, 1, 64, 64), dtype=np.float32)})
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        logger.info("🔥 Warmed up %d session(s) at batch sizes %s in %.1fms", len(self.sessions), list(batch_sizes), elapsed_ms)
+        return elapsed_ms
+
+
+session_pool = None
+
+# ========================================
+# Dynamic micro-batching for ONNX inference
+# ========================================
+batching_enabled = os.environ.get("SILA_BATCHING", "1") != "0"
+batch_max_size = int(os.environ.get("SILA_BATCH_MAX_SIZE", "8"))  # Max frames per session.run
+batch_max_wait_ms = float(os.environ.get("SILA_BATCH_MAX_WAIT_MS", "5"))  # Max time the first frame waits for company
+
+
+class InferenceBatcher:
+    """Collects frames from concurrent requests into one batched session.run call.
+
+    A batch is flushed when it holds max_batch_size frames or when the first
+    frame in it has waited max_wait_ms, whichever comes first. Each caller gets
+    back only the output rows for the frames it submitted.
+    """
+
+    def __init__(self, pool, max_batch_size=batch_max_size, max_wait_ms=batch_max_wait_ms):
+        self.pool = pool
+        self.max_wait = max_wait_ms / 1000.0
+        self.max_batch_size = max(1, max_batch_size)
+
+        # Models exported with a fixed batch dimension can only take that many rows at once
+        batch_dim = pool.input_shape[0]
+        self.fixed_batch = batch_dim if isinstance(batch_dim, int) and batch_dim > 0 else None
+        if self.fixed_batch is not None:
+            self.max_batch_size = self.fixed_batch
+
+        self._queue = queue.Queue()
+        self._thread = None
+        self._start_lock = threading.Lock()
+        self._closed = False
+        # One collector thread forms batches; each pooled session runs one batch at a time
+        self._runners = ThreadPoolExecutor(max_workers=len(pool.sessions), thread_name_prefix="inference-runner")
+
+    def _ensure_started(self):
+        if self._thread is None:
+            with self._start_lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._worker, name="inference-batcher", daemon=True)
+                    self._thread.start()
+
+    def submit(self, img_array):
+        """Queue a [n, 1, 64, 64] array and return a Future for its [n, classes] output"""
+        if self._closed:
+            raise RuntimeError("Inference batcher is closed")
+        self._ensure_started()
+        future = Future()
+        self._queue.put((img_array, future))
+        return future
+
+    def run(self, img_array):
+        """Blocking inference through the batcher"""
+        return self.submit(img_array).result()
+
+    async def infer(self, img_array):
+        """Await inference through the batcher without blocking the event loop"""
+        return await asyncio.wrap_future(self.submit(img_array))
+
+    def close(self):
+        """Stop collecting batches; frames already queued still run"""
+        self._closed = True
+        with self._start_lock:
+            if self._thread is None:
+                self._runners.shutdown(wait=False)
+                return
+        self._queue.put(None)
+
+    def _worker(self):
+        while True:
+            first = self._queue.get()
+            if first is None:
+                self._runners.shutdown(wait=False)
+                return
+            # Claiming a future makes it uncancellable; a caller that already went away is dropped,
+            # so its cancelled future can't make set_result fail for the rest of the batch
+            if not first[1].set_running_or_notify_cancel():
+                continue
+            items = [first]
+            rows = first[0].shape[0]
+            deadline = time.monotonic() + self.max_wait
+
+            # Keep collecting until the batch is full or the first frame's wait budget is spent
+            while rows < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    self._queue.put(None)  # Closing: flush this batch, then stop
+                    break
+                if not item[1].set_running_or_notify_cancel():
+                    continue
+                items.append(item)
+                rows += item[0].shape[0]
+
+            self._runners.submit(self._process, items)
+
+    def _process(self, items):
+        try:
+            if len(items) == 1:
+                batch = items[0][0]
+            else:
+                batch = np.concatenate([item[0] for item in items], axis=0)
+            start = time.perf_counter()
+            try:
+                outputs = self._run_batch(batch)
+            finally:
+                worker_pool.add_busy(time.perf_counter() - start)
+        except Exception as e:
+            for _, future in items:
+                future.set_exception(e)
+            return
+
+        offset = 0
+        for img_array, future in items:
+            rows = img_array.shape[0]
+            future.set_result(outputs[offset:offset + rows])
+            offset += rows
+
+    def _run_batch(self, batch):
+        if self.fixed_batch is None or batch.shape[0] == self.fixed_batch:
+            return self.pool.run(batch)
+        # Fixed-batch model: split into chunks it accepts
+        return np.concatenate([
+            self.pool.run(batch[i:i + self.fixed_batch])
+            for i in range(0, batch.shape[0], self.fixed_batch)
+        ], axis=0)
+
+
+inference_batcher = None
+
+
+# ========================================
+# Model lifecycle: loaded in the background at startup
+# ========================================
+model_state = {
+    "status": "not_loaded",  # not_loaded | loading | warming_up | ready | failed
+    "version": None,
+    "path": None,
+    "error": None,
+    "load_ms": None,
+    "warmup_ms": None,
+    "warmup_batch_sizes": [],
+}
+model_loaded = threading.Event()  # Set once loading has finished, successfully or not
+
+
+class ModelNotReady(Exception):
+    """Raised when a frame arrives before the model has finished loading"""
+
+
+def session_config():
+    """The inference settings currently in effect"""
+    return {
+        "model_variant": model_variant,
+        "optimization_level": ort_optimization_level,
+        "intra_op_threads": ort_intra_op_threads,
+        "inter_op_threads": ort_inter_op_threads,
+        "execution_mode": ort_execution_mode,
+        "session_pool_size": len(session_pool.sessions) if session_pool is not None else 0,
+        "batching": inference_batcher is not None,
+        "batch_max_size": inference_batcher.max_batch_size if inference_batcher is not None else 1,
+        "batch_max_wait_ms": batch_max_wait_ms,
+    }
+
+
+def load_model():
+    """Load, validate and warm up the newest model version. Runs on a background thread at startup."""
+    model_state.update(status="loading", error=None)
+    try:
+        logger.info("🔄 Loading ONNX model...")
+        serving_path = resolve_serving_path()
+        model = ModelVersion(model_version_name(serving_path), serving_path)
+        model_state.update(status="warming_up", path=serving_path, load_ms=model.load_ms)
+        logger.info("✅ Model loaded successfully from %s (%d session(s), optimization %s, %d intra-op thread(s))",
+                    serving_path, len(model.pool.sessions), ort_optimization_level, ort_intra_op_threads)
+
+        # Validate the model
+        if not validate_model(model.pool.sessions[0]):
+            logger.warning("⚠️  Model validation failed, but continuing...")
+
+        model.warm_up()
+        registry.activate(model)
+
+    except Exception as e:
+        logger.error("❌ Error loading model: %s", e)
+        model_state.update(status="failed", error=str(e))
+    finally:
+        model_loaded.set()
+        registry.start_watching()
+
+
+# ========================================
+# Model registry: versioned models, hot reload and shadow evaluation
+# ========================================
+models_dir = os.environ.get("SILA_MODELS_DIR", "")  # Versioned models as <version>.onnx / <version>.ort (empty = SILA_MODEL_PATH only)
+models_poll_interval = float(os.environ.get("SILA_MODELS_POLL", "5"))  # Seconds between directory scans (0 = admin calls only)
+model_drain_s = float(os.environ.get("SILA_MODEL_DRAIN", "10"))  # Seconds a replaced version keeps serving frames that picked it up
+admin_token = os.environ.get("SILA_ADMIN_TOKEN", "")  # Enables the /admin/models endpoints when set
+shadow_new_models = os.environ.get("SILA_SHADOW", "0") != "0"  # New versions from the directory start as shadow candidates
+shadow_fraction = float(os.environ.get("SILA_SHADOW_FRACTION", "0.1"))  # Share of frames also run on the candidate
+shadow_min_frames = int(os.environ.get("SILA_SHADOW_MIN_FRAMES", "200"))  # Shadowed frames before auto-promotion is considered
+shadow_promote_agreement = float(os.environ.get("SILA_SHADOW_PROMOTE_AGREEMENT", "0"))  # Top-1 agreement that auto-promotes (0 = manual)
+
+
+def model_version_name(path):
+    """assets/model.onnx -> "model"; the INT8 copy of a version has the same name"""
+    stem = os.path.splitext(os.path.basename(path))[0]
+    return stem[:-len(".int8")] if stem.endswith(".int8") else stem
+
+
+def available_models():
+    """{version: path} for the model files in models_dir, oldest first"""
+    if not models_dir or not os.path.isdir(models_dir):
+        return {}
+    found = []
+    for entry in os.scandir(models_dir):
+        stem, ext = os.path.splitext(entry.name)
+        if entry.is_file() and ext in (".onnx", ".ort") and not stem.endswith((".int8", ".shared")):
+            found.append((entry.stat().st_mtime, stem, entry.path))
+    return {version: path for _, version, path in sorted(found)}
+
+
+def initial_model_path():
+    """The most recently written version in models_dir, or SILA_MODEL_PATH"""
+    versions = available_models()
+    return list(versions.values())[-1] if versions else model_path
+
+
+class ModelVersion:
+    """One loaded model version with the sessions and batcher serving it"""
+
+    def __init__(self, version, path):
+        start = time.perf_counter()
+        self.version = version
+        self.path = path
+        self.pool = SessionPool(path, size=session_pool_size)
+        self.load_ms = (time.perf_counter() - start) * 1000
+        # Warm up at the batch sizes requests will actually use: single frames, the fallback sweep, full batches
+        self.batch_sizes = sorted({1, len(FALLBACK_METHODS), batch_max_size if batching_enabled else 1})
+        self.warmup_ms = None
+        self.batcher = None
+        self.in_flight = 0  # Inference calls running on this version, only touched from the event loop
+
+    def warm_up(self):
+        self.warmup_ms = self.pool.warm_up(self.batch_sizes)
+        if batching_enabled:
+            self.batcher = InferenceBatcher(self.pool)
+            logger.info("✅ Micro-batching enabled (max batch %d, max wait %sms)", self.batcher.max_batch_size, batch_max_wait_ms)
+
+    async def infer(self, img_array):
+        self.in_flight += 1
+        try:
+            if self.batcher is not None:
+                return await self.batcher.infer(img_array)
+            return await worker_pool.run(self.pool.run, img_array)
+        finally:
+            self.in_flight -= 1
+
+    def describe(self):
+        return {"version": self.version, "path": self.path, "load_ms": self.load_ms, "warmup_ms": self.warmup_ms}
+
+
+class ShadowReport:
+    """Top-1 agreement and latency of a candidate against the active model on the same frames.
+
+    Active latency is the serving path's own inference time, batching wait
+    included; the candidate runs alone on its sessions.
+    """
+
+    def __init__(self, candidate, active):
+        self.candidate = candidate
+        self.active = active
+        self.frames = 0
+        self.agreed = 0
+        self.active_ms = collections.deque(maxlen=1000)
+        self.candidate_ms = collections.deque(maxlen=1000)
+        self._lock = threading.Lock()
+
+    def observe(self, active_output, candidate_output, active_ms, candidate_ms):
+        with self._lock:
+            self.frames += 1
+            self.agreed += int(active_output.argmax() == candidate_output.argmax())
+            self.active_ms.append(active_ms)
+            self.candidate_ms.append(candidate_ms)
+
+    @property
+    def agreement(self):
+        return self.agreed / self.frames if self.frames else None
+
+    def summary(self):
+        with self._lock:
+            latency = {}
+            for name, samples in (("active_ms", self.active_ms), ("candidate_ms", self.candidate_ms)):
+                latency[name] = ({"p50": float(np.percentile(samples, 50)), "p99": float(np.percentile(samples, 99))}
+                                 if samples else None)
+            return {"candidate": self.candidate, "active": self.active, "frames": self.frames,
+                    "agreement": self.agreement, **latency}
+
+
+class ModelRegistry:
+    """Versioned models with background loading, atomic promotion and shadow evaluation.
+
+    The active version serves every frame. A new version, found in models_dir
+    or named in an admin call, is loaded, validated and warmed up on a
+    background thread while the active one keeps serving. It is then either
+    promoted at once or kept as a shadow candidate: a sampled share of frames
+    also runs on it, and the registry reports its top-1 agreement and latency
+    against the active model until it is promoted or discarded. Promotion
+    swaps a single reference. A frame that already picked up the old version
+    finishes on it, and the old version's batcher stops once it has drained.
+    Client stabilization state is untouched; frame caches and calibrations,
+    which are model specific, reset on each client's next frame.
+    """
+
+    def __init__(self):
+        self.active = None
+        self.candidate = None
+        self.shadow_report = None
+        self.history = []  # (version, promoted at), oldest first
+        self._seen = {}  # version -> mtime of the file last considered
+        self._lock = threading.Lock()  # One load or promotion at a time
+        self._shadow_slots = threading.BoundedSemaphore(2)  # Shadow runs may lag; drop samples rather than queue them
+        self._shadow_runner = ThreadPoolExecutor(max_workers=1, thread_name_prefix="shadow")
+        self._watcher = None
+
+    @property
+    def busy(self):
+        return self._lock.locked()
+
+    def activate(self, model):
+        """Make model the serving version and retire the one it replaces"""
+        global session, session_pool, inference_batcher
+        previous, self.active = self.active, model
+        session, session_pool, inference_batcher = model.pool.sessions[0], model.pool, model.batcher
+        self.history.append((model.version, time.time()))
+        model_state.update(status="ready", version=model.version, path=model.path, error=None, load_ms=model.load_ms,
+                           warmup_ms=model.warmup_ms, warmup_batch_sizes=model.batch_sizes)
+        logger.info("🚀 Serving model version %s", model.version)
+        if previous is not None and previous is not model:
+            self._retire(previous)
+
+    def _retire(self, model):
+        def drain():
+            time.sleep(model_drain_s)
+            while model.in_flight:
+                time.sleep(0.1)
+            if model.batcher is not None:
+                model.batcher.close()
+            logger.info("🗑️  Retired model version %s", model.version)
+
+        threading.Thread(target=drain, name="model-drain", daemon=True).start()
+
+    def load(self, version, path, shadow=False):
+        """Load, validate and warm up a version, then promote it or start shadowing it. Blocks the caller."""
+        with self._lock:
+            serving_path = resolve_serving_path(path)
+            logger.info("🔄 Loading model version %s from %s", version, serving_path)
+            model = ModelVersion(version, serving_path)
+            if not validate_model(model.pool.sessions[0]):
+                raise ValueError(f"model version {version} failed validation")
+            model.warm_up()
+            if shadow and self.active is not None:
+                previous, self.candidate = self.candidate, model
+                self.shadow_report = ShadowReport(model.version, self.active.version)
+                logger.info("👥 Shadowing model version %s against %s on %.0f%% of frames",
+                            model.version, self.active.version, shadow_fraction * 100)
+                if previous is not None:
+                    self._retire(previous)
+            else:
+                self.activate(model)
+            return model
+
+    def promote(self):
+        """Make the shadow candidate the serving version; returns it, or None without a candidate"""
+        with self._lock:
+            model, self.candidate = self.candidate, None
+            if model is not None:
+                self.activate(model)
+            return model
+
+    def discard(self):
+        """Stop shadowing the candidate; returns it, or None without a candidate"""
+        with self._lock:
+            model, self.candidate = self.candidate, None
+            if model is not None:
+                self._retire(model)
+            return model
+
+    def shadow(self, model, img_array, active_output, active_ms):
+        """Run a sampled frame on the candidate too, off the request path.
+
+        model is the version that served the frame, with its output and
+        inference time; only the candidate runs again, so shadowing costs the
+        active sessions nothing.
+        """
+        candidate, report = self.candidate, self.shadow_report
+        if candidate is None or model is not self.active or random.random() >= shadow_fraction:
+            return
+        if not self._shadow_slots.acquire(blocking=False):
+            return
+        # The request's input buffer goes back to the worker pool when it returns
+        self._shadow_runner.submit(self._run_shadow, candidate, report, img_array.copy(), active_output, active_ms)
+
+    def _run_shadow(self, candidate, report, img_array, active_output, active_ms):
+        try:
+            start = time.perf_counter()
+            candidate_output = candidate.pool.run(img_array)
+            report.observe(active_output, candidate_output, active_ms, (time.perf_counter() - start) * 1000)
+        except Exception as e:
+            logger.warning("⚠️  Shadow inference failed on model version %s: %s", candidate.version, e)
+            return
+        finally:
+            self._shadow_slots.release()
+        if (shadow_promote_agreement > 0 and report.frames >= shadow_min_frames
+                and report.agreement >= shadow_promote_agreement and self.candidate is candidate):
+            logger.info("✅ Model version %s agrees on %.1f%% of %d shadowed frames, promoting",
+                        candidate.version, report.agreement * 100, report.frames)
+            self.promote()
+
+    def scan(self):
+        """Load versions added to (or rewritten in) models_dir since the last scan, oldest first"""
+        now = time.time()
+        for version, path in available_models().items():
+            try:
+                mtime = os.path.getmtime(path)
+            except OSError:
+                continue
+            if self._seen.get(version) == mtime or now - mtime < 2:
+                continue  # Unchanged, or possibly still being copied in
+            self._seen[version] = mtime
+            if self.active is not None and self.active.version == version and self.active.path == path:
+                continue  # The file the server started with
+            try:
+                self.load(version, path, shadow=shadow_new_models)
+            except Exception as e:
+                logger.error("❌ Could not load model version %s: %s", version, e)
+
+    def start_watching(self):
+        """Poll models_dir for new versions on a background thread"""
+        if not models_dir or models_poll_interval <= 0 or self._watcher is not None:
+            return
+        self._seen = {version: os.path.getmtime(path) for version, path in available_models().items()}
+
+        def watch():
+            while True:
+                time.sleep(models_poll_interval)
+                try:
+                    self.scan()
+                except Exception as e:
+                    logger.error("❌ Model directory scan failed: %s", e)
+
+        self._watcher = threading.Thread(target=watch, name="model-watcher", daemon=True)
+        self._watcher.start()
+        logger.info("👀 Watching %s for new model versions every %ss", models_dir, models_poll_interval)
+
+    def status(self):
+        return {
+            "active": self.active.describe() if self.active is not None else None,
+            "candidate": self.candidate.describe() if self.candidate is not None else None,
+            "shadow": self.shadow_report.summary() if self.shadow_report is not None else None,
+            "available": list(available_models()),
+            "history": [{"version": version, "promoted_at": at} for version, at in self.history],
+            "loading": self.busy,
+        }
+
+
+registry = ModelRegistry()
+
+
+# ========================================
+# Bounded worker pool for CPU-bound work
+# ========================================
+worker_threads = int(os.environ.get("SILA_WORKER_THREADS", str(os.cpu_count() or 4)))
+worker_queue_depth = int(os.environ.get("SILA_WORKER_QUEUE_DEPTH", str(worker_threads * 4)))  # In-flight frames before 429
+decode_processes = int(os.environ.get("SILA_DECODE_PROCESSES", "0"))  # >0 decodes JPEGs in a process pool
+
+
+class PoolSaturated(Exception):
+    """Raised when the worker pool already holds its maximum number of frames"""
+
+
+class WorkerPool:
+    """Runs decode, preprocessing and inference away from the asyncio event loop.
+
+    Threads are used for NumPy and ONNX Runtime work, which release the GIL.
+    JPEG decoding can optionally go to a process pool. Admission is bounded:
+    once max_pending frames are in flight, slot() raises PoolSaturated
+    (load_monitor.admit() normally refuses them earlier).
+    Each admitted frame borrows a preallocated float32 model-input buffer
+    for the lifetime of its slot.
+    """
+
+    def __init__(self, max_workers=worker_threads, max_pending=worker_queue_depth, decode_workers=decode_processes,
+                 frame_shape=(1, 1, 64, 64)):
+        self.threads = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="sila-worker")
+        self.decode_workers = decode_workers
+        self.processes = None
+        self.max_pending = max_pending
+        self.pending = 0  # Only touched from the event loop thread, so no lock is needed
+        self.busy_s = 0.0  # Seconds worker threads and batched session runs spent executing
+        self.frames_done = 0  # Frames recognized, from any endpoint; the unit busy_s is spread over
+        self._busy_lock = threading.Lock()
+        self.frame_shape = frame_shape
+        self._free_buffers = []
+
+    @asynccontextmanager
+    async def slot(self):
+        if self.pending >= self.max_pending:
+            raise PoolSaturated()
+        self.pending += 1
+        # At most max_pending buffers ever exist, since every buffer is tied to a slot
+        buffer = self._free_buffers.pop() if self._free_buffers else np.empty(self.frame_shape, dtype=np.float32)
+        try:
+            yield buffer
+        finally:
+            self._free_buffers.append(buffer)
+            self.pending -= 1
+
+    async def run(self, fn, *args):
+        """Run fn(*args) on a worker thread"""
+        return await asyncio.get_running_loop().run_in_executor(self.threads, self._timed, fn, *args)
+
+    def _timed(self, fn, *args):
+        start = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            self.add_busy(time.perf_counter() - start)
+
+    def add_busy(self, seconds):
+        """Count execution time for load estimates (called from any thread)"""
+        with self._busy_lock:
+            self.busy_s += seconds
+
+    def start(self):
+        """Start the decode processes, when configured (called from the lifespan)"""
+        if self.decode_workers <= 0 or self.processes is not None:
+            return
+        # Forking a process that already runs ORT and worker threads can copy held locks
+        # into the child and deadlock it; forkserver children start from a clean process
+        method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        self.processes = ProcessPoolExecutor(max_workers=self.decode_workers,
+                                             mp_context=multiprocessing.get_context(method))
+
+    def stop(self):
+        if self.processes is not None:
+            self.processes.shutdown(wait=False, cancel_futures=True)
+            self.processes = None
+
+    async def run_decode(self, fn, *args):
+        """Run a decode step, in a worker process when the pool was started"""
+        if self.processes is None:
+            return await self.run(fn, *args)
+        return await asyncio.get_running_loop().run_in_executor(self.processes, fn, *args)
+
+
+worker_pool = WorkerPool()
+
+# Admission control and client pacing
+target_latency_ms = float(os.environ.get("SILA_TARGET_LATENCY_MS", "150"))  # Frame latency the pacing steers towards
+max_queue_wait_ms = float(os.environ.get("SILA_MAX_QUEUE_WAIT_MS", "500"))  # Estimated wait past which frames get 429
+min_capture_interval_ms = float(os.environ.get("SILA_MIN_CAPTURE_INTERVAL_MS", "80"))  # Fastest pace suggested (~12 FPS)
+max_capture_interval_ms = float(os.environ.get("SILA_MAX_CAPTURE_INTERVAL_MS", "2000"))
+idle_interval_factor = float(os.environ.get("SILA_IDLE_INTERVAL_FACTOR", "2.5"))  # Slow-down for stable or unchanged scenes
+
+
+class Overloaded(PoolSaturated):
+    """Raised when a new frame would wait longer than max_queue_wait_ms"""
+
+
+class LoadMonitor:
+    """Sheds excess frames and tells clients how fast to send.
+
+    Keeps a moving average of end-to-end frame latency and samples the
+    worker pool's queue depth. Service time per frame is the worker threads'
+    busy time (decode, preprocessing, session runs) divided by the frames
+    recognized in the same second, live, tensor and transcription frames
+    alike, so a running transcription adds to both sides rather than
+    inflating the estimate. A frame is refused when the pool is full or when
+    the queue times the service time, spread over the inference sessions,
+    exceeds max_queue_wait_ms. End-to-end latency and stage laps already
+    contain the wait for a thread or batch, so they would count the queueing
+    delay twice. Once a second the pacing scale grows by 25% while the server
+    is under pressure (latency over target, the queue over half full, or
+    frames shed) and shrinks by 10% while it has headroom, so the suggested
+    capture interval tracks total load as clients come and go. Only used from
+    the event loop.
+    """
+
+    def __init__(self, pool, window_s=1.0):
+        self.pool = pool
+        self.window_s = window_s
+        self.latency_ms = 0.0
+        self.service_ms = 0.0
+        self.scale = 1.0
+        self._window_start = time.monotonic()
+        self._pending_sum = 0
+        self._samples = 0
+        self._shed_in_window = 0
+        self._busy_at_window_start = 0.0
+        self._frames_at_window_start = 0
+
+    def estimated_wait_ms(self):
+        sessions = len(session_pool.sessions) if session_pool is not None else 1
+        return self.pool.pending * self.service_ms / sessions
+
+    def admit(self):
+        """Raise Overloaded instead of queueing a frame that would wait too long"""
+        self._tick()
+        self._pending_sum += self.pool.pending
+        self._samples += 1
+        if self.pool.pending >= self.pool.max_pending or self.estimated_wait_ms() > max_queue_wait_ms:
+            self.reject()
+            raise Overloaded()
+
+    def reject(self):
+        """Count a refused frame"""
+        metrics.count("shed")
+        self._shed_in_window += 1
+
+    def record(self, elapsed_ms):
+        """Fold a finished frame's end-to-end latency into the moving average"""
+        self.latency_ms = elapsed_ms if self.latency_ms == 0 else 0.8 * self.latency_ms + 0.2 * elapsed_ms
+
+    def _tick(self):
+        now = time.monotonic()
+        if now - self._window_start < self.window_s:
+            return
+        busy_ms = (self.pool.busy_s - self._busy_at_window_start) * 1000
+        frames = self.pool.frames_done - self._frames_at_window_start
+        if frames:
+            service_ms = busy_ms / frames
+            self.service_ms = service_ms if self.service_ms == 0 else 0.5 * self.service_ms + 0.5 * service_ms
+        mean_pending = self._pending_sum / self._samples if self._samples else 0.0
+        pressure = max(self.latency_ms / target_latency_ms, 2 * mean_pending / self.pool.max_pending)
+        if pressure > 1 or self._shed_in_window:
+            self.scale = min(self.scale * 1.25, max_capture_interval_ms / min_capture_interval_ms)
+        elif pressure < 0.5:
+            self.scale = max(self.scale / 1.1, 1.0)
+        self._window_start = now
+        self._pending_sum = self._samples = self._shed_in_window = 0
+        self._busy_at_window_start = self.pool.busy_s
+        self._frames_at_window_start = self.pool.frames_done
+
+    def capture_interval_ms(self, idle=False):
+        """Milliseconds a client should wait before its next frame"""
+        interval = min_capture_interval_ms * self.scale * (idle_interval_factor if idle else 1.0)
+        return int(min(max(interval, min_capture_interval_ms), max_capture_interval_ms))
+
+    def retry_after_s(self):
+        """Whole seconds until the current queue should have drained (Retry-After)"""
+        return max(1, math.ceil(self.estimated_wait_ms() / 1000))
+
+    def snapshot(self):
+        return {"pending": self.pool.pending, "latency_ms": round(self.latency_ms, 2),
+                "service_ms": round(self.service_ms, 2),
+                "capture_interval_ms": self.capture_interval_ms(), "shed": metrics.total("shed")}
+
 
-# Stability system to prevent rapid letter changes
-prediction_history = []
-last_stable_prediction = None
-stability_threshold = 3  # Need 3 consistent predictions to change
-min_confidence_threshold = 0.1  # Minimum confidence for any prediction (lowered for better results)
+load_monitor = LoadMonitor(worker_pool)
 
-# Prediction smoothing system
-prediction_buffer = []
-buffer_size = 5  # Keep last 5 predictions for smoothing
 
-def smooth_prediction(predicted_class, confidence):
-    """Apply smoothing to reduce prediction noise"""
-    global prediction_buffer, buffer_size
-    
-    # Add current prediction to buffer
-    prediction_buffer.append((predicted_class, confidence))
-    
-    # Keep only last N predictions
-    if len(prediction_buffer) > buffer_size:
-        prediction_buffer.pop(0)
-    
-    # If buffer is not full, return current prediction
-    if len(prediction_buffer) < buffer_size:
-        return predicted_class, confidence
-    
-    # Calculate weighted average based on confidence
-    class_counts = {}
-    total_confidence = 0
-    
-    for cls, conf in prediction_buffer:
-        if cls not in class_counts:
-            class_counts[cls] = 0
-        class_counts[cls] += conf
-        total_confidence += conf
-    
-    # Find the class with highest weighted confidence
-    if total_confidence > 0:
-        best_class = max(class_counts.items(), key=lambda x: x[1])[0]
-        best_confidence = class_counts[best_class]
-        
-        # Only use smoothed prediction if it's significantly better
-        if best_confidence > confidence * 1.2:  # 20% improvement threshold
-            return best_class, best_confidence
-    
-    return predicted_class, confidence
-
-def is_prediction_stable(predicted_class, confidence):
-    """Check if prediction is stable enough to be displayed"""
-    global prediction_history, last_stable_prediction, stability_threshold
-    
-    # Add current prediction to history
-    prediction_history.append((predicted_class, confidence))
-    
-    # Keep only last 10 predictions
-    if len(prediction_history) > 10:
-        prediction_history.pop(0)
-    
-    # If we don't have enough history, don't change
-    if len(prediction_history) < stability_threshold:
-        return False
-    
-    # Check if last N predictions are the same class
-    recent_predictions = [p[0] for p in prediction_history[-stability_threshold:]]
-    is_stable = len(set(recent_predictions)) == 1 and recent_predictions[0] == predicted_class
-    
-    # Additional stability check: confidence should be above threshold
-    if confidence < min_confidence_threshold:
-        return False
-    
-    # If prediction is stable and different from last stable, update
-    if is_stable and (last_stable_prediction is None or last_stable_prediction != predicted_class):
-        last_stable_prediction = predicted_class
-        return True
-    
-    # If prediction is stable and same as last stable, maintain
-    if is_stable and last_stable_prediction == predicted_class:
-        return True
-    
-    return False
+def decode_grayscale(data, size=64):
+    """Decode request bytes straight to a size x size uint8 grayscale array.
 
-def validate_model():
-    """Validate that the model is working correctly"""
-    global session
-    try:
-        print("🔍 Validating model...")
-        
-        # Create a test image (simple pattern)
-        test_img = np.random.randint(0, 255, (64, 64), dtype=np.uint8)
-        test_img = Image.fromarray(test_img)
-        
-        # Test basic preprocessing (avoid calling the complex function)
-        img_array = np.array(test_img.convert("L").resize((64, 64)), dtype=np.float32)
-        img_array = (img_array / 255.0 - 0.5) / 0.5  # Simple normalization
-        img_array = np.expand_dims(np.expand_dims(img_array, axis=0), axis=0)
-        print(f"✅ Preprocessing test passed")
-        
-        # Test inference
-        input_name = session.get_inputs()[0].name
-        prediction = session.run(None, {input_name: img_array})[0]
-        
-        print(f"✅ Inference test passed:")
-        print(f"  Input shape: {img_array.shape}")
-        print(f"  Output shape: {prediction.shape}")
-        print(f"  Output range: [{np.min(prediction):.4f}, {np.max(prediction):.4f}]")
-        
-        # Test confidence calculation
-        confidence = np.max(prediction)
-        confidence_percent = (confidence / np.sum(np.abs(prediction))) * 100 if np.sum(np.abs(prediction)) > 0 else 0
-        print(f"  Test confidence: {confidence:.4f} ({confidence_percent:.2f}%)")
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ Model validation failed: {e}")
-        return False
+    For JPEGs, draft mode makes libjpeg emit grayscale at the smallest DCT
+    scale (1/2, 1/4 or 1/8) that still covers size x size, so a 320px frame
+    is decoded at 160px with no RGB round trip.
+    """
+    img = Image.open(io.BytesIO(data))
+    img.draft("L", (size, size))  # No-op for formats other than JPEG
+    if img.mode != "L":
+        img = img.convert("L")
+    return np.asarray(img.resize((size, size)))
 
-# Load the ONNX model
-try:
-    print("🔄 Loading ONNX model...")
-    session = ort.InferenceSession(model_path)
-    print("✅ Model loaded successfully from", model_path)
-    
-    # Validate the model
-    if not validate_model():
-        print("⚠️  Model validation failed, but continuing...")
-    
-except Exception as e:
-    print(f"❌ Error loading model: {e}")
-    session = None
+
+def decode_hand_crop(data, tracker, size=64):
+    """Decode request bytes, crop to the tracked hand and resize to a size x size uint8 grayscale array.
+
+    JPEGs are drafted straight to YCbCr near roi_analysis_size: the Y plane
+    is the grayscale frame and Cb/Cr feed the skin mask, with no RGB step.
+    """
+    img = Image.open(io.BytesIO(data))
+    img.draft("YCbCr", (roi_analysis_size, roi_analysis_size))
+    if img.mode != "YCbCr":
+        img = img.convert("YCbCr")
+    return crop_hand(np.asarray(img), tracker, size)
+
+
+def crop_hand(ycbcr, tracker, size=64):
+    """Crop a YCbCr frame's luma to the tracked hand and resize it to size x size"""
+    box = tracker.locate(ycbcr)
+    luma = ycbcr[..., 0]
+    if box is not None:
+        top, bottom, left, right = box
+        luma = luma[top:bottom, left:right]
+    return np.asarray(Image.fromarray(np.ascontiguousarray(luma)).resize((size, size)))
+
+
+async def run_model(img_array, model=None):
+    """Run a model version (default: the active one) on a [n, 1, 64, 64] array, batching when enabled"""
+    if model is None:
+        model = registry.active
+    return await model.infer(img_array)
 
 # ========================================
 # Preprocessing the image to match model input
@@ -182,62 +1979,91 @@ def preprocess_image_alternative2(img: Image.Image, size=64):
     img_array = np.expand_dims(img_array, axis=0)  # Shape: [1, 3, 64, 64]
     return img_array
 
-def preprocess_image_optimized(img: Image.Image, size=64):
-    """Completely rewritten preprocessing to fix accuracy issues"""
+STANDARD_METHOD = "Original [-1,1]"  # What preprocess_image_optimized applies
+
+
+def preprocess_image_optimized(gray: np.ndarray, size=64, out=None):
+    """Completely rewritten preprocessing to fix accuracy issues
+
+    Takes the size x size uint8 frame from decode_grayscale and writes the model
+    input into out, a reusable [1, 1, size, size] float32 buffer, when given.
+    Only the standard [-1,1] normalization is computed; other methods are
+    chosen per session by NormalizationCalibration or the fallback sweep.
+    """
+    if out is None:
+        out = np.empty((1, 1, size, size), dtype=np.float32)
     try:
-        # Convert to grayscale and resize
-        img = img.convert("L").resize((size, size))
-        
-        # Convert to numpy array
-        img_array = np.array(img, dtype=np.float32)
-        
-        # Try multiple preprocessing methods and pick the best one
-        preprocessing_methods = []
-        
-        # Method 1: Standard [0,1] normalization
-        method1 = img_array / 255.0
-        preprocessing_methods.append(("Standard [0,1]", method1))
-        
-        # Method 2: Z-score normalization
-        method2 = (img_array - np.mean(img_array)) / (np.std(img_array) + 1e-8)
-        preprocessing_methods.append(("Z-score", method2))
-        
-        # Method 3: Min-max normalization [-1,1]
-        method3 = 2 * (img_array - np.min(img_array)) / (np.max(img_array) - np.min(img_array) + 1e-8) - 1
-        preprocessing_methods.append(("Min-max [-1,1]", method3))
-        
-        # Method 4: Standard ImageNet normalization (most common for trained models)
-        method4 = (img_array / 255.0 - 0.5) / 0.5
-        preprocessing_methods.append(("Standard [-1,1]", method4))
-        
-        # Method 5: Simple normalization without offset
-        method5 = img_array / 255.0
-        preprocessing_methods.append(("Simple [0,1]", method5))
-        
-        # Method 6: Robust normalization (handle outliers)
-        p2, p98 = np.percentile(img_array, (2, 98))
-        method6 = np.clip((img_array - p2) / (p98 - p2), 0, 1)
-        preprocessing_methods.append(("Robust [0,1]", method6))
-        
-        # Method 7: Enhanced contrast and brightness
-        method7 = np.clip((img_array - 128) / 128, -1, 1)
-        preprocessing_methods.append(("Enhanced [-1,1]", method7))
-        
-        # Use the standard method first (most likely to work with trained models)
-        img_array = method4
-        
-        # Ensure proper shape: [1, 1, 64, 64]
-        img_array = np.expand_dims(img_array, axis=0)  # Add batch dimension
-        img_array = np.expand_dims(img_array, axis=0)  # Add channel dimension
-        
-        return img_array, "Original [-1,1]"
+        # Standard ImageNet normalization (most common for trained models)
+        # (x / 255 - 0.5) / 0.5, written straight into the model input buffer
+        np.multiply(gray, 2 / 255.0, out=out[0, 0], casting="unsafe")
+        out -= 1.0
+        return out, STANDARD_METHOD
         
     except Exception as e:
-        print(f"❌ Preprocessing error: {e}")
+        logger.warning("❌ Preprocessing error: %s", e)
         # Fallback to basic preprocessing
-        img_array = np.array(img.convert("L").resize((size, size)), dtype=np.float32) / 255.0
-        img_array = np.expand_dims(np.expand_dims(img_array, axis=0), axis=0)
-        return img_array, "Fallback [0,1]"
+        np.multiply(gray, 1 / 255.0, out=out[0, 0], casting="unsafe")
+        return out, "Fallback [0,1]"
+
+
+
+def normalization_coefficients(gray: np.ndarray, methods=FALLBACK_METHODS):
+    """Scale and offset per method such that scale * gray + offset is that normalization"""
+    scale = np.empty(len(methods), dtype=np.float32)
+    offset = np.empty(len(methods), dtype=np.float32)
+    for i, method in enumerate(methods):
+        if method == "Standard [0,1]":
+            scale[i], offset[i] = 1 / 255.0, 0.0
+        elif method == "Z-score":
+            mean, std = gray.mean(), gray.std()
+            scale[i] = 1 / (std + 1e-8)
+            offset[i] = -mean * scale[i]
+        elif method == "Min-max [-1,1]":
+            lo, hi = gray.min(), gray.max()
+            scale[i] = 2 / (float(hi) - float(lo) + 1e-8)
+            offset[i] = -float(lo) * scale[i] - 1
+        elif method in ("ImageNet [-1,1]", "Original [-1,1]"):
+            scale[i], offset[i] = 2 / 255.0, -1.0
+        elif method == "Enhanced [-1,1]":
+            scale[i], offset[i] = 1 / 128.0, -1.0
+        elif method == "Robust [0,1]":
+            p2, p98 = np.percentile(gray, (2, 98))
+            scale[i] = 1 / (p98 - p2 + 1e-8)
+            offset[i] = -p2 * scale[i]
+        else:
+            raise ValueError(f"Unknown normalization: {method}")
+    return scale, offset
+
+
+# Output range of the clipped normalizations
+NORMALIZATION_CLIPS = {"Enhanced [-1,1]": (-1, 1), "Robust [0,1]": (0, 1)}
+
+
+def build_fallback_batch(gray: np.ndarray, size=64):
+    """Stack every fallback normalization of one grayscale frame into a [6, 1, size, size] batch"""
+    batch = np.empty((len(FALLBACK_METHODS), 1, size, size), dtype=np.float32)
+    out = batch[:, 0]
+
+    # Every method is an affine map a * x + b (some clipped), so compute them all in one broadcast
+    scale, offset = normalization_coefficients(gray)
+    np.multiply(gray, scale[:, None, None], out=out, casting="unsafe")
+    out += offset[:, None, None]
+    for i, method in enumerate(FALLBACK_METHODS):
+        if method in NORMALIZATION_CLIPS:
+            np.clip(out[i], *NORMALIZATION_CLIPS[method], out=out[i])
+    return batch
+
+
+def normalize_frame(gray: np.ndarray, method, out):
+    """Apply a single named normalization into a [1, 1, size, size] buffer"""
+    scale, offset = normalization_coefficients(gray, (method,))
+    target = out[0, 0]
+    np.multiply(gray, scale[0], out=target, casting="unsafe")
+    target += offset[0]
+    if method in NORMALIZATION_CLIPS:
+        np.clip(target, *NORMALIZATION_CLIPS[method], out=target)
+    return out, method
+
 
 @app.get("/")
 async def root():
@@ -245,13 +2071,584 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy", "service": "sign-recognition"}
+    status = {"ready": "healthy", "failed": "degraded"}.get(model_state["status"], "starting")
+    return {"status": status, "service": "sign-recognition", "model": model_state["status"],
+            "frame_cache": {"hits": metrics.total("cache_hits"), "misses": metrics.total("cache_misses")},
+            "load": load_monitor.snapshot()}
+
+@app.get("/metrics")
+async def prometheus_metrics():
+    """Stage latency histograms and counters in Prometheus text format (summed over all workers)"""
+    return Response(content=metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+@app.post("/debug/profile")
+async def capture_profile(seconds: float = 10.0, interval_ms: float = 5.0):
+    """Sample this worker's Python stacks for `seconds` and return them as collapsed stacks (SILA_PROFILER=1)"""
+    if not profiler_enabled:
+        return JSONResponse(status_code=404, content={"error": "Profiling is disabled; start the server with SILA_PROFILER=1"})
+    if seconds <= 0 or interval_ms <= 0:
+        return JSONResponse(status_code=400, content={"error": "seconds and interval_ms must be positive"})
+    seconds = min(seconds, profile_max_seconds)
+    try:
+        # Off the worker pool, so the capture doesn't take a thread from the requests it is watching
+        stacks = await asyncio.get_running_loop().run_in_executor(None, profiler.capture, seconds, interval_ms / 1000)
+    except ProfilerBusy:
+        return JSONResponse(status_code=409, content={"error": "A profile is already being captured"})
+    body = "".join(f"{stack} {count}\n" for stack, count in stacks.most_common())
+    return Response(content=body, media_type="text/plain; charset=utf-8",
+                    headers={"X-Sila-Profile-Samples": str(sum(stacks.values()))})
+
+def admin_denied(request):
+    """The error response for a request without the admin token, or None when it may proceed"""
+    if not admin_token:
+        return JSONResponse(status_code=404, content={"error": "Model administration is disabled; set SILA_ADMIN_TOKEN"})
+    if not hmac.compare_digest(request.headers.get("x-sila-admin-token", ""), admin_token):
+        return JSONResponse(status_code=403, content={"error": "Missing or wrong X-Sila-Admin-Token"})
+    return None
+
+@app.get("/admin/models")
+async def model_registry_status(request: Request):
+    """Active and candidate versions, shadow agreement and latency, and the versions on disk"""
+    return admin_denied(request) or registry.status()
+
+@app.post("/admin/models/load")
+async def load_model_version(request: Request, version: str, shadow: bool = False):
+    """Load a version from SILA_MODELS_DIR (or reload SILA_MODEL_PATH) and promote it, or shadow it first.
+
+    With several workers each process has its own registry and this only
+    reaches the one that answers; drop versions into SILA_MODELS_DIR instead.
+    """
+    denied = admin_denied(request)
+    if denied:
+        return denied
+    versions = available_models()
+    if not versions and version == model_version_name(model_path):
+        versions = {version: model_path}
+    if version not in versions:
+        return JSONResponse(status_code=404, content={"error": f"Unknown model version {version!r}", "available": list(versions)})
+    if registry.busy:
+        return JSONResponse(status_code=409, content={"error": "Another model version is loading"})
+    try:
+        await asyncio.get_running_loop().run_in_executor(None, registry.load, version, versions[version], shadow)
+    except Exception as e:
+        logger.error("❌ Could not load model version %s: %s", version, e)
+        return JSONResponse(status_code=400, content={"error": f"Could not load model version {version}: {str(e)}"})
+    return registry.status()
+
+@app.post("/admin/models/promote")
+async def promote_model_version(request: Request):
+    """Serve the shadow candidate"""
+    denied = admin_denied(request)
+    if denied:
+        return denied
+    model = await asyncio.get_running_loop().run_in_executor(None, registry.promote)
+    if model is None:
+        return JSONResponse(status_code=409, content={"error": "No candidate model version to promote"})
+    return registry.status()
+
+@app.delete("/admin/models/candidate")
+async def discard_model_version(request: Request):
+    """Stop shadowing the candidate without promoting it"""
+    denied = admin_denied(request)
+    if denied:
+        return denied
+    model = await asyncio.get_running_loop().run_in_executor(None, registry.discard)
+    if model is None:
+        return JSONResponse(status_code=409, content={"error": "No candidate model version to discard"})
+    return registry.status()
+
+@app.get("/health/live")
+async def liveness():
+    """The process is up and serving the event loop"""
+    return {"status": "alive"}
+
+@app.get("/health/ready")
+async def readiness():
+    """Ready once the model is loaded and warmed up; 503 until then (or if loading failed)"""
+    body = {
+        "ready": model_state["status"] == "ready",
+        "model": dict(model_state),
+        "session_config": session_config(),
+    }
+    return JSONResponse(status_code=200 if body["ready"] else 503, content=body)
+
+# ========================================
+# Responses
+# ========================================
+def dump_json(content):
+    """Serialize a response body to UTF-8 JSON bytes, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered by dump_json; skips FastAPI's jsonable_encoder pass when returned directly"""
+
+    def render(self, content):
+        return dump_json(content)
+
+
+def wants_debug(connection):
+    """Debug details are opt-in: ?debug=1 or an X-Sila-Debug: 1 header"""
+    flag = connection.query_params.get("debug") or connection.headers.get("x-sila-debug") or ""
+    return flag.lower() in ("1", "true", "yes")
+
+
+# Class mapping: Map model output directly to Arabic letters
+class_mapping = {
+    0: "ع",      # ain
+    1: "ال",     # al
+    2: "أ",      # aleff
+    3: "ب",      # bb
+    4: "د",      # dal
+    5: "ظ",      # dha
+    6: "ض",      # dhad
+    7: "ف",      # fa
+    8: "ق",      # gaaf
+    9: "غ",      # ghain
+    10: "هـ",    # ha
+    11: "ح",     # haa
+    12: "ج",     # jeem
+    13: "ك",     # kaaf
+    14: "خ",     # khaa
+    15: "لا",    # la
+    16: "ل",     # laam
+    17: "م",     # meem
+    18: "ن",     # nun
+    19: "ر",     # ra
+    20: "ص",     # saad
+    21: "س",     # seen
+    22: "ش",     # sheen
+    23: "ت",     # ta
+    24: "ط",     # taa
+    25: "ث",     # thaa
+    26: "ذ",     # thal
+    27: "ت",     # toot
+    28: "و",     # waw
+    29: "ي",     # ya
+    30: "يا",    # yaa
+    31: "ز",     # zay
+}
+
+UNKNOWN_TEXT = "غير معروف"
+# Label per model output index, built once instead of a dict lookup and f-string per frame
+class_labels = tuple(class_mapping.get(i, f"{UNKNOWN_TEXT} (class {i})") for i in range(max(num_classes, len(class_mapping))))
+
+
+def label_for(predicted_class):
+    if 0 <= predicted_class < len(class_labels):
+        return class_labels[predicted_class]
+    return f"{UNKNOWN_TEXT} (class {predicted_class})"
+
+
+def top_predictions(prediction, k=3):
+    """[(class, label, softmax probability)] for the k best outputs, best first"""
+    scores = prediction.reshape(-1)
+    k = min(k, scores.size)
+    top = np.argpartition(scores, -k)[-k:]
+    top = top[np.argsort(scores[top])[::-1]]
+    probabilities = np.exp(scores - scores[top[0]])
+    probabilities /= probabilities.sum()
+    return [(int(c), label_for(int(c)), float(probabilities[c])) for c in top]
+
+
+async def recognize_frame(data, client, frame_buffer, gray=None, prefetched=None, debug=False, timer=None):
+    """Decode, preprocess, run and stabilize one frame; returns the response dict
+
+    Callers that already hold the decoded 64x64 frame pass it as gray, and
+    may pass prefetched = (prediction, preprocessing_method) from a batched
+    run; it is used when the frame would have been run with that method.
+    With neither data nor gray (client-normalized tensors), prefetched is the
+    prediction, and the pixel-based cache, calibration and sweep are skipped.
+    timer, when given, is a StageTimer the stages are charged to. The response is {text, confidence, class} plus the
+    suggested capture_interval_ms, with "words" once the word decoder has
+    something to show and a debug dict when asked.
+    """
+    if model_state["status"] not in ("ready", "failed"):
+        raise ModelNotReady()
+    metrics.count("frames")
+    worker_pool.frames_done += 1
+    if timer is None:
+        timer = StageTimer()
+    stabilizer = client.stabilizer
+    # Decode bytes to a 64x64 grayscale frame, cropped to the hand when ROI tracking is on
+    if data is not None and roi_enabled:
+        gray = await worker_pool.run(decode_hand_crop, data, client.hand_tracker)
+    elif data is not None:
+        gray = await worker_pool.run_decode(decode_grayscale, data)
+    if data is not None:
+        timer.lap("decode")
+    has_pixels = gray is not None
+
+    # Check if model is loaded
+    if model_state["status"] == "failed":
+        # Placeholder mode - return random English pronunciations (readiness reports the failure)
+        english_pronunciations = ["ain", "al", "aleff", "bb", "dal", "dha", "dhad", "fa", "gaaf", "ghain", "ha", "haa", "jeem", "kaaf", "khaa", "la", "laam", "meem", "nun", "ra", "saad", "seen", "sheen", "ta", "taa", "thaa", "thal", "toot", "waw", "ya", "yaa", "zay"]
+        predicted_text = random.choice(english_pronunciations)
+        confidence = 0.85
+        metrics.count("placeholder")
+        return {"text": predicted_text, "confidence": confidence, "placeholder": True}
+
+    # Pin the serving version so a hot swap mid-frame doesn't mix two models
+    model = registry.active
+    if client.model_version != model.version:
+        if client.model_version is not None:
+            client.frame_cache.entries.clear()
+            client.calibration.reset()
+        client.model_version = model.version
+
+    # Use the optimized preprocessing method for this specific model
+    try:
+        # Detail messages are only built for traced frames
+        trace = frame_trace_level()
+
+        # Motion gate: a frame that barely differs from a recent one reuses its model output
+        cached = client.frame_cache.lookup(gray) if dedup_threshold > 0 and has_pixels else None
+
+        calibration = client.calibration if calibration_enabled and cached is None and has_pixels else None
+        calibrated_method = calibration.current_method(time.monotonic()) if calibration is not None else None
+        searched = False  # Whether this frame already tried the alternative normalizations
+
+        if cached is not None:
+            prediction, preprocessing_method = cached
+            searched = True
+            if trace:
+                logger.log(trace, "♻️  Frame unchanged, reusing cached prediction (%s)", preprocessing_method)
+        elif calibration is not None and calibrated_method is None:
+            # Calibrating: score every normalization on this frame in one batched call
+            candidates = await worker_pool.run(build_fallback_batch, gray, 64)
+            candidate_predictions = await run_model(candidates, model)
+            candidate_confidences = candidate_predictions.max(axis=1)
+            calibration.observe(candidate_confidences, time.monotonic())
+            best = int(np.argmax(candidate_confidences))
+            prediction = candidate_predictions[best:best + 1]
+            preprocessing_method = FALLBACK_METHODS[best]
+            searched = True
+            timer.lap("calibrate")
+            if trace:
+                logger.log(trace, "🎛️  Calibrating (%d/%d): best method this frame %s",
+                           calibration.frames_seen, calibration_frames, preprocessing_method)
+        elif prefetched is not None and (not has_pixels or prefetched[1] == (calibrated_method or STANDARD_METHOD)):
+            prediction, preprocessing_method = prefetched
+            searched = calibrated_method is not None or not has_pixels
+        else:
+            if calibrated_method is not None:
+                # Steady state: only the transform this client calibrated to
+                img_array, preprocessing_method = await worker_pool.run(normalize_frame, gray, calibrated_method, frame_buffer)
+                searched = True
+            else:
+                img_array, preprocessing_method = await worker_pool.run(preprocess_image_optimized, gray, 64, frame_buffer)
+            timer.lap("preprocess")
+
+            if trace:
+                logger.log(trace, "🔍 Processing image: expected shape %s, actual shape %s, input type %s, preprocessing %s",
+                           [dim if dim != -1 else 'batch' for dim in session.get_inputs()[0].shape],
+                           img_array.shape, img_array.dtype, preprocessing_method)
+
+            # Run inference
+            start = time.perf_counter()
+            prediction = await run_model(img_array, model)
+            active_ms = (time.perf_counter() - start) * 1000
+            timer.lap("infer")
+            registry.shadow(model, img_array, prediction, active_ms)
+
+        if cached is None and dedup_threshold > 0 and has_pixels:
+            client.frame_cache.store(gray, prediction, preprocessing_method)
+
+        if trace:
+            logger.log(trace, "✅ Inference successful: output shape %s, output type %s", prediction.shape, prediction.dtype)
+
+        # Get predicted class and confidence
+        predicted_class = int(prediction.argmax())
+        confidence = float(prediction.flat[predicted_class])
+
+        # Apply prediction smoothing
+        smoothed_class, smoothed_confidence = stabilizer.smooth(predicted_class, confidence)
+
+        # Use smoothed prediction if it's better
+        if smoothed_confidence > confidence:
+            predicted_class = smoothed_class
+            confidence = smoothed_confidence
+            if trace:
+                logger.log(trace, "🎯 Smoothed prediction: class %s (confidence %.4f)", smoothed_class, smoothed_confidence)
+
+        # Calculate confidence percentage for better understanding
+        # Top softmax probability: the max term of exp(x - max) is 1, so it is 1 / sum
+        confidence_percent = 100.0 / float(np.exp(prediction - prediction.max()).sum())
+
+        if trace:
+            logger.log(trace, "🎯 Prediction results: class %s, raw confidence %.4f, confidence %.2f%%, raw values %s...",
+                       predicted_class, confidence, confidence_percent, prediction.flatten()[:5])
+
+        # Dynamic confidence threshold based on model performance
+        if confidence_percent < 20.0:  # Very low confidence
+            CONFIDENCE_THRESHOLD = 0.1   # Lower threshold for low confidence
+        elif confidence_percent < 50.0:  # Medium confidence
+            CONFIDENCE_THRESHOLD = 0.3   # Medium threshold
+        else:
+            CONFIDENCE_THRESHOLD = 0.5   # Higher threshold for high confidence
+
+        # Apply stricter confidence requirements for stability
+        if confidence < min_confidence_threshold:
+            if trace:
+                logger.log(trace, "🚫 Confidence too low for stability: %.4f < %s", confidence, min_confidence_threshold)
+            response = {"text": UNKNOWN_TEXT, "confidence": confidence, "class": predicted_class,
+                        "capture_interval_ms": load_monitor.capture_interval_ms(idle=cached is not None)}
+            if client.word_decoder is not None:
+                client.word_decoder.observe(None, prediction)
+                words = client.word_decoder.state()
+                if words:
+                    response["words"] = words
+            metrics.count("unknown")
+            if debug:
+                response["debug"] = {
+                    "preprocessing_method": preprocessing_method,
+                    "confidence_raw": confidence,
+                    "confidence_percent": confidence_percent,
+                    "predicted_class": predicted_class,
+                    "model_output_shape": list(prediction.shape),
+                    "threshold_used": CONFIDENCE_THRESHOLD,
+                    "is_stable": False,
+                    "last_stable_class": stabilizer.last_stable_prediction,
+                    "stability_threshold": stability_threshold,
+                    "prediction_history_length": stabilizer.history_count,
+                    "cache_hit": cached is not None,
+                    "roi": client.hand_tracker.normalized_box(),
+                    "top_predictions": top_predictions(prediction),
+                    "reason": "confidence_below_minimum"
+                }
+            timer.lap("stabilize")
+            return response
+
+        # If confidence is too low, try alternative preprocessing methods (unless calibration already did)
+        if confidence < CONFIDENCE_THRESHOLD and not searched:
+            if trace:
+                logger.log(trace, "⚠️  Low confidence prediction (%.4f < %s), trying alternative preprocessing methods",
+                           confidence, CONFIDENCE_THRESHOLD)
+
+            # Try all preprocessing methods in one batched inference call
+            metrics.count("fallback_sweeps")
+            fallback_batch = await worker_pool.run(build_fallback_batch, gray, 64)
+            fallback_predictions = await run_model(fallback_batch, model)
+            fallback_confidences = fallback_predictions.max(axis=1)
+            fallback_classes = fallback_predictions.argmax(axis=1)
+
+            if trace:
+                logger.log(trace, "🔄 Fallback sweep: %s", ", ".join(
+                    f"{name} -> class {cls} ({conf:.4f})"
+                    for name, cls, conf in zip(FALLBACK_METHODS, fallback_classes, fallback_confidences)))
+
+            # Use the better result
+            best = int(np.argmax(fallback_confidences))
+            best_confidence = float(fallback_confidences[best])
+            best_prediction = fallback_predictions[best:best + 1]
+            best_method = FALLBACK_METHODS[best]
+            best_class = int(fallback_classes[best])
+
+            # Update with best result
+            if best_confidence > confidence:
+                prediction = best_prediction
+                predicted_class = best_class
+                confidence = best_confidence
+                preprocessing_method = best_method
+                if dedup_threshold > 0:
+                    client.frame_cache.store(gray, prediction, preprocessing_method)
+                if trace:
+                    logger.log(trace, "🎉 Using %s preprocessing (confidence %.4f)", best_method, best_confidence)
+            timer.lap("fallback")
+
+        # Record the frame in the stability history exactly once, whatever the threshold decides
+        is_stable = stabilizer.is_stable(predicted_class, confidence)
+
+        # Final confidence check
+        if confidence < CONFIDENCE_THRESHOLD:
+            if trace:
+                logger.log(trace, "⚠️  Final low confidence prediction (%.4f < %s)", confidence, CONFIDENCE_THRESHOLD)
+            predicted_text = UNKNOWN_TEXT
+        else:
+            if is_stable:
+                predicted_text = label_for(predicted_class)
+                if trace:
+                    logger.log(trace, "✅ STABLE prediction: %s (class %s) with confidence %.4f", predicted_text, predicted_class, confidence)
+            else:
+                # Use last stable prediction if available, otherwise show unknown
+                last_stable = stabilizer.last_stable_prediction
+                if last_stable is not None:
+                    predicted_text = label_for(last_stable)
+                    if trace:
+                        logger.log(trace, "🔄 UNSTABLE - using last stable: %s (class %s)", predicted_text, last_stable)
+                else:
+                    predicted_text = UNKNOWN_TEXT
+                    if trace:
+                        logger.log(trace, "⏳ Building stability - need %d consistent predictions", stability_threshold)
+
+            # Show stability info
+            if trace:
+                recent_classes = stabilizer.recent_classes(5) if stabilizer.history_count >= 5 else []
+                logger.log(trace, "📊 Stability: Recent classes: %s, Stable threshold: %d", recent_classes, stability_threshold)
+
+        # A held sign or an unchanged scene needs fewer frames
+        idle = cached is not None or (is_stable and predicted_text != UNKNOWN_TEXT)
+        response = {"text": predicted_text, "confidence": confidence, "class": predicted_class,
+                    "capture_interval_ms": load_monitor.capture_interval_ms(idle=idle)}
+        if client.word_decoder is not None:
+            stable_class = predicted_class if is_stable and confidence >= CONFIDENCE_THRESHOLD else None
+            client.word_decoder.observe(stable_class, prediction)
+            words = client.word_decoder.state()
+            if words:
+                response["words"] = words
+        if predicted_text == UNKNOWN_TEXT:
+            metrics.count("unknown")
+        if debug:
+            # Comprehensive debug info, only built when the client asks for it
+            response["debug"] = {
+                "preprocessing_method": preprocessing_method,
+                "confidence_raw": confidence,
+                "confidence_percent": confidence_percent,
+                "predicted_class": predicted_class,
+                "model_output_shape": list(prediction.shape),
+                "threshold_used": CONFIDENCE_THRESHOLD,
+                "is_stable": is_stable,
+                "last_stable_class": stabilizer.last_stable_prediction,
+                "stability_threshold": stability_threshold,
+                "prediction_history_length": stabilizer.history_count,
+                "cache_hit": cached is not None,
+                "roi": client.hand_tracker.normalized_box(),
+                "top_predictions": top_predictions(prediction)
+            }
+        timer.lap("stabilize")
+        return response
+
+    except Exception as e:
+        metrics.count("errors")
+        logger.error("❌ Model inference error: %s", e)
+        return {
+            "error": f"Model inference failed: {str(e)}",
+            "text": UNKNOWN_TEXT,
+            "confidence": 0.0,
+            "class": -1
+        }
+
+
+async def prefetch_predictions(grays, client):
+    """Run several frames in one batch with the method recognize_frame would use; None while calibrating"""
+    if model_state["status"] != "ready":
+        return None
+    # Each frame counts itself against the calibration in recognize_frame; a batch only looks
+    method = client.calibration.peek_method(time.monotonic()) if calibration_enabled else None
+    if calibration_enabled and method is None:
+        return None  # Calibrating frames score every method anyway
+
+    def build():
+        batch = np.empty((len(grays), 1, 64, 64), dtype=np.float32)
+        for i, gray in enumerate(grays):
+            if method is None:
+                preprocess_image_optimized(gray, 64, batch[i:i + 1])
+            else:
+                normalize_frame(gray, method, batch[i:i + 1])
+        return batch
+
+    predictions = await run_model(await worker_pool.run(build))
+    return [(predictions[i:i + 1], method or STANDARD_METHOD) for i in range(len(grays))]
+
+# ========================================
+# Raw tensor uploads
+# ========================================
+# Clients that preprocess themselves POST Content-Type: application/x-sila-tensor
+# to /api/sign/recognize: a 16-byte little-endian header, then the frames.
+#   magic "SILA" | version u8 | dtype u8 | norm u8 | pad u8 | frames u32 | height u16 | width u16
+# dtype 0 = uint8 grayscale pixels (norm 0), normalized and calibrated like decoded JPEGs;
+# dtype 1 = float32 model input already normalized by the method named by norm.
+TENSOR_CONTENT_TYPE = "application/x-sila-tensor"
+TENSOR_HEADER = struct.Struct("<4sBBBxIHH")
+TENSOR_MAGIC = b"SILA"
+TENSOR_VERSION = 1
+TENSOR_DTYPES = (np.dtype(np.uint8), np.dtype(np.float32))
+TENSOR_NORMS = ("pixels", STANDARD_METHOD) + FALLBACK_METHODS
+tensor_max_frames = int(os.environ.get("SILA_TENSOR_MAX_FRAMES", "64"))  # Frames per upload
+
+
+class TensorFormatError(ValueError):
+    """A raw tensor upload whose header or length doesn't check out"""
+
+
+def encode_tensor(frames, norm="pixels"):
+    """Build an upload body from [n, 64, 64] uint8 pixels or [n, 1, 64, 64] float32 normalized input"""
+    frames = np.ascontiguousarray(frames)
+    height, width = frames.shape[-2:]
+    header = TENSOR_HEADER.pack(TENSOR_MAGIC, TENSOR_VERSION, TENSOR_DTYPES.index(frames.dtype),
+                                TENSOR_NORMS.index(norm), frames.shape[0], height, width)
+    return header + frames.tobytes()
+
+
+def parse_tensor(body):
+    """Zero-copy view of an upload's frames, and its norm tag.
+
+    Pixels come back as [n, 64, 64] uint8 and normalized input as
+    [n, 1, 64, 64] float32, both reading straight from the request body.
+    """
+    if len(body) < TENSOR_HEADER.size:
+        raise TensorFormatError("Body shorter than the tensor header")
+    magic, version, dtype_code, norm_code, count, height, width = TENSOR_HEADER.unpack_from(body)
+    if magic != TENSOR_MAGIC or version != TENSOR_VERSION:
+        raise TensorFormatError(f"Expected a version {TENSOR_VERSION} tensor header")
+    if dtype_code >= len(TENSOR_DTYPES) or norm_code >= len(TENSOR_NORMS):
+        raise TensorFormatError("Unknown dtype or normalization tag")
+    dtype, norm = TENSOR_DTYPES[dtype_code], TENSOR_NORMS[norm_code]
+    if (norm == "pixels") != (dtype == np.uint8):
+        raise TensorFormatError("uint8 tensors carry raw pixels (norm 0); float32 tensors must name their normalization")
+    if (height, width) != (64, 64):
+        raise TensorFormatError(f"Frames must be 64x64, got {height}x{width}")
+    if not 1 <= count <= tensor_max_frames:
+        raise TensorFormatError(f"Frame count must be between 1 and {tensor_max_frames}")
+    values = count * height * width
+    if len(body) != TENSOR_HEADER.size + values * dtype.itemsize:
+        raise TensorFormatError("Body length doesn't match the header")
+    frames = np.frombuffer(body, dtype=dtype, count=values, offset=TENSOR_HEADER.size)
+    if norm == "pixels":
+        return frames.reshape(count, height, width), norm
+    return frames.reshape(count, 1, height, width), norm
+
+
+async def recognize_tensor(body, client, frame_buffer, debug=False, timer=None):
+    """Recognize the frames of a raw tensor upload, in order, with one batched inference call.
+
+    A single frame gets the usual response dict; several get {"results": [...]}.
+    """
+    if timer is None:
+        timer = StageTimer()
+    frames, norm = parse_tensor(body)
+    timer.lap("decode")
+    if model_state["status"] not in ("ready", "failed"):
+        raise ModelNotReady()
+    results = []
+    if norm == "pixels":
+        prefetched = await prefetch_predictions(frames, client) if len(frames) > 1 else None
+        if prefetched:
+            timer.lap("infer")
+        for i, gray in enumerate(frames):
+            results.append(await recognize_frame(None, client, frame_buffer, gray=gray,
+                                                 prefetched=prefetched[i] if prefetched else None, debug=debug,
+                                                 timer=timer))
+    else:
+        # Already the model input: no decode, no copy before the session
+        predictions = await run_model(frames) if model_state["status"] == "ready" else None
+        timer.lap("infer")
+        for i in range(len(frames)):
+            prefetched = (predictions[i:i + 1], norm) if predictions is not None else None
+            results.append(await recognize_frame(None, client, frame_buffer, prefetched=prefetched, debug=debug,
+                                                 timer=timer))
+    return results[0] if len(results) == 1 else {"results": results}
+
 
 @app.post("/api/sign/recognize")
 async def recognize_sign(request: Request):
     try:
         # Get the image data from the request body
+        timer = StageTimer()
         data = await request.body()
+        timer.lap("read")
         content_type = request.headers.get("content-type", "unknown")
 
         if not data:
@@ -260,243 +2657,456 @@ async def recognize_sign(request: Request):
                 content={"error": "No image data received"}
             )
         
-        # Convert bytes to PIL Image
-        img = Image.open(io.BytesIO(data)).convert("RGB")
-        
-        # Check if model is loaded
-        if session is None:
-            # Placeholder mode - return random English pronunciations
-            import random
-            english_pronunciations = ["ain", "al", "aleff", "bb", "dal", "dha", "dhad", "fa", "gaaf", "ghain", "ha", "haa", "jeem", "kaaf", "khaa", "la", "laam", "meem", "nun", "ra", "saad", "seen", "sheen", "ta", "taa", "thaa", "thal", "toot", "waw", "ya", "yaa", "zay"]
-            predicted_text = random.choice(english_pronunciations)
-            confidence = 0.85
-        else:
-            # Use the optimized preprocessing method for this specific model
-            try:
-                img_array, preprocessing_method = preprocess_image_optimized(img, size=64)
-                
-                # Get model input/output names
-                input_name = session.get_inputs()[0].name
-                output_name = session.get_outputs()[0].name
-                
-                print(f"🔍 Processing image:")
-                print(f"  Expected shape: {[dim if dim != -1 else 'batch' for dim in session.get_inputs()[0].shape]}")
-                print(f"  Actual shape: {img_array.shape}")
-                print(f"  Input type: {img_array.dtype}")
-                print(f"  Preprocessing method: {preprocessing_method}")
-                
-                # Run inference
-                prediction = session.run(None, {input_name: img_array})[0]
-                
-                print(f"✅ Inference successful!")
-                print(f"  Output shape: {prediction.shape}")
-                print(f"  Output type: {prediction.dtype}")
-                
-                # Get predicted class and confidence
-                predicted_class = np.argmax(prediction)
-                confidence = np.max(prediction)
-                
-                # Apply prediction smoothing
-                smoothed_class, smoothed_confidence = smooth_prediction(predicted_class, confidence)
-                
-                # Use smoothed prediction if it's better
-                if smoothed_confidence > confidence:
-                    predicted_class = smoothed_class
-                    confidence = smoothed_confidence
-                    print(f"🎯 Smoothed prediction: class {smoothed_class} (confidence improved from {confidence:.4f} to {smoothed_confidence:.4f})")
-                
-                # Calculate confidence percentage for better understanding
-                # Use softmax to get proper probability distribution
-                prediction_softmax = np.exp(prediction - np.max(prediction))
-                prediction_softmax = prediction_softmax / np.sum(prediction_softmax)
-                confidence_percent = np.max(prediction_softmax) * 100
-                
-                print(f"🎯 Prediction results:")
-                print(f"  Predicted class: {predicted_class}")
-                print(f"  Raw confidence: {confidence:.4f}")
-                print(f"  Confidence percentage: {confidence_percent:.2f}%")
-                print(f"  Raw prediction values: {prediction.flatten()[:5]}...")
-                
-                # Dynamic confidence threshold based on model performance
-                if confidence_percent < 20.0:  # Very low confidence
-                    CONFIDENCE_THRESHOLD = 0.1   # Lower threshold for low confidence
-                elif confidence_percent < 50.0:  # Medium confidence
-                    CONFIDENCE_THRESHOLD = 0.3   # Medium threshold
-                else:
-                    CONFIDENCE_THRESHOLD = 0.5   # Higher threshold for high confidence
-                
-                # Apply stricter confidence requirements for stability
-                if confidence < min_confidence_threshold:
-                    print(f"🚫 Confidence too low for stability: {confidence:.4f} < {min_confidence_threshold}")
-                    predicted_text = "غير معروف"
-                    return {
-                        "text": str(predicted_text),
-                        "confidence": float(confidence),
-                        "class": int(predicted_class),
-                        "debug": {
-                            "preprocessing_method": str(preprocessing_method),
-                            "confidence_raw": float(confidence),
-                            "confidence_percent": float(confidence_percent),
-                            "predicted_class": int(predicted_class),
-                            "model_output_shape": [int(x) for x in prediction.shape],
-                            "threshold_used": float(CONFIDENCE_THRESHOLD),
-                            "is_stable": False,
-                            "last_stable_class": int(last_stable_prediction) if last_stable_prediction is not None else None,
-                            "stability_threshold": int(stability_threshold),
-                            "prediction_history_length": int(len(prediction_history)),
-                            "reason": "confidence_below_minimum"
-                        }
-                    }
-                
-                # If confidence is too low, try alternative preprocessing methods
-                if confidence < CONFIDENCE_THRESHOLD:
-                    print(f"⚠️  Low confidence prediction ({confidence:.4f} < {CONFIDENCE_THRESHOLD})")
-                    print("🔄 Trying alternative preprocessing methods...")
-                    
-                    # Try all preprocessing methods to find the best one
-                    best_confidence = confidence
-                    best_prediction = prediction
-                    best_method = preprocessing_method
-                    best_class = predicted_class
-                    
-                    for method_name, method_func in [
-                        ("Standard [0,1]", lambda x: x / 255.0),
-                        ("Z-score", lambda x: (x - np.mean(x)) / (np.std(x) + 1e-8)),
-                        ("Min-max [-1,1]", lambda x: 2 * (x - np.min(x)) / (np.max(x) - np.min(x) + 1e-8) - 1),
-                        ("ImageNet [-1,1]", lambda x: (x / 255.0 - 0.5) / 0.5),
-                        ("Enhanced [-1,1]", lambda x: np.clip((x - 128) / 128, -1, 1)),
-                        ("Robust [0,1]", lambda x: np.clip((x - np.percentile(x, 2)) / (np.percentile(x, 98) - np.percentile(x, 2)), 0, 1))
-                    ]:
-                        try:
-                            # Apply alternative preprocessing
-                            img_alt = np.array(img.convert("L").resize((64, 64)), dtype=np.float32)
-                            img_alt = method_func(img_alt)
-                            img_alt = np.expand_dims(np.expand_dims(img_alt, axis=0), axis=0)
-                            
-                            # Run inference with alternative preprocessing
-                            prediction_alt = session.run(None, {input_name: img_alt})[0]
-                            confidence_alt = np.max(prediction_alt)
-                            predicted_class_alt = np.argmax(prediction_alt)
-                            
-                            print(f"  🔄 {method_name}: class {predicted_class_alt}, confidence {confidence_alt:.4f}")
-                            
-                            # Use the better result
-                            if confidence_alt > best_confidence:
-                                best_confidence = confidence_alt
-                                best_prediction = prediction_alt
-                                best_method = method_name
-                                best_class = predicted_class_alt
-                                print(f"    ✅ Better result found!")
-                                
-                        except Exception as e:
-                            print(f"    ❌ {method_name} failed: {e}")
-                    
-                    # Update with best result
-                    if best_confidence > confidence:
-                        prediction = best_prediction
-                        predicted_class = best_class
-                        confidence = best_confidence
-                        preprocessing_method = best_method
-                        print(f"🎉 Using {best_method} preprocessing (confidence improved from {confidence:.4f} to {best_confidence:.4f})")
-                
-                # Final confidence check
-                if confidence < CONFIDENCE_THRESHOLD:
-                    print(f"⚠️  Final low confidence prediction ({confidence:.4f} < {CONFIDENCE_THRESHOLD})")
-                    predicted_text = "غير معروف"  # Unknown
-                else:
-                    # Class mapping: Map model output directly to Arabic letters
-                    class_mapping = {
-                        0: "ع",      # ain
-                        1: "ال",     # al
-                        2: "أ",      # aleff
-                        3: "ب",      # bb
-                        4: "د",      # dal
-                        5: "ظ",      # dha
-                        6: "ض",      # dhad
-                        7: "ف",      # fa
-                        8: "ق",      # gaaf
-                        9: "غ",      # ghain
-                        10: "هـ",    # ha
-                        11: "ح",     # haa
-                        12: "ج",     # jeem
-                        13: "ك",     # kaaf
-                        14: "خ",     # khaa
-                        15: "لا",    # la
-                        16: "ل",     # laam
-                        17: "م",     # meem
-                        18: "ن",     # nun
-                        19: "ر",     # ra
-                        20: "ص",     # saad
-                        21: "س",     # seen
-                        22: "ش",     # sheen
-                        23: "ت",     # ta
-                        24: "ط",     # taa
-                        25: "ث",     # thaa
-                        26: "ذ",     # thal
-                        27: "ت",     # toot
-                        28: "و",     # waw
-                        29: "ي",     # ya
-                        30: "يا",    # yaa
-                        31: "ز",     # zay
-                    }
-
-                    # Check if prediction is stable
-                    is_stable = is_prediction_stable(predicted_class, confidence)
-                    
-                    if is_stable:
-                        predicted_text = class_mapping.get(predicted_class, f"غير معروف (class {predicted_class})")
-                        print(f"✅ STABLE prediction: {predicted_text} (class {predicted_class}) with confidence {confidence:.4f}")
-                    else:
-                        # Use last stable prediction if available, otherwise show unknown
-                        if last_stable_prediction is not None:
-                            predicted_text = class_mapping.get(last_stable_prediction, f"غير معروف (class {last_stable_prediction})")
-                            print(f"🔄 UNSTABLE - using last stable: {predicted_text} (class {last_stable_prediction})")
-                        else:
-                            predicted_text = "غير معروف"
-                            print(f"⏳ Building stability - need {stability_threshold} consistent predictions")
-                    
-                    # Show stability info
-                    recent_classes = [int(p[0]) for p in prediction_history[-5:]] if len(prediction_history) >= 5 else []
-                    print(f"📊 Stability: Recent classes: {recent_classes}, Stable threshold: {stability_threshold}")
-                
-                # Add comprehensive debug info to response - convert ALL numpy types
-                debug_info = {
-                    "preprocessing_method": str(preprocessing_method),
-                    "confidence_raw": float(confidence),
-                    "confidence_percent": float(confidence_percent),
-                    "predicted_class": int(predicted_class),
-                    "model_output_shape": [int(x) for x in prediction.shape],
-                    "threshold_used": float(CONFIDENCE_THRESHOLD),
-                    "is_stable": bool(is_prediction_stable(predicted_class, confidence)),
-                    "last_stable_class": int(last_stable_prediction) if last_stable_prediction is not None else None,
-                    "stability_threshold": int(stability_threshold),
-                    "prediction_history_length": int(len(prediction_history))
-                }
-                
-                # Convert numpy types to Python native types for JSON serialization
-                return {
-                    "text": str(predicted_text),
-                    "confidence": float(confidence),
-                    "class": int(predicted_class),
-                    "debug": debug_info
-                }
-                
-            except Exception as e:
-                print(f"❌ Model inference error: {e}")
-                return {
-                    "error": f"Model inference failed: {str(e)}",
-                    "text": "غير معروف",
-                    "confidence": 0.0,
-                    "class": -1
-                }
+        # Reserve a slot in the worker pool; shed the frame instead of queueing it too long
+        load_monitor.admit()
+        async with worker_pool.slot() as frame_buffer:
+            session_id = get_session_id(request)
+            client = client_sessions.get(session_id)
+            debug = wants_debug(request)
+            if content_type.split(";")[0].strip() == TENSOR_CONTENT_TYPE:
+                recognize = recognize_tensor(data, client, frame_buffer, debug=debug, timer=timer)
+            else:
+                recognize = recognize_frame(data, client, frame_buffer, debug=debug, timer=timer)
+            if shared_stabilizers is None:
+                result = await recognize
+            else:
+                shared_stabilizers.load(session_id, client)
+                try:
+                    result = await recognize
+                finally:
+                    shared_stabilizers.save(session_id, client)
+        stages = timer.finish()
+        load_monitor.record(stages["total"])
+        result.setdefault("capture_interval_ms", load_monitor.capture_interval_ms())
+        metrics.observe_stages(stages)
+        return FastJSONResponse(result, headers={"Server-Timing": timer.server_timing()})
 
+    except TensorFormatError as e:
+        return JSONResponse(
+            status_code=400,
+            content={"error": f"Invalid tensor upload: {str(e)}"}
+        )
+    except PoolSaturated:
+        return JSONResponse(
+            status_code=429,
+            headers={"Retry-After": str(load_monitor.retry_after_s())},
+            content={"error": "Server busy, please slow down",
+                     "capture_interval_ms": load_monitor.capture_interval_ms()}
+        )
+    except ModelNotReady:
+        return JSONResponse(
+            status_code=503,
+            headers={"Retry-After": "1"},
+            content={"error": "Model is still loading, please retry shortly"}
+        )
     except Exception as e:
-        print(f"Error processing request: {str(e)}")
+        logger.error("Error processing request: %s", e)
         return JSONResponse(
             status_code=500,
             content={"error": f"Internal server error: {str(e)}"}
         )
 
+# ========================================
+# WebSocket streaming recognition
+# ========================================
+@app.websocket("/ws/sign/recognize")
+async def recognize_sign_stream(websocket: WebSocket):
+    """Continuous recognition over one connection.
+
+    Each binary message is a 4-byte big-endian frame sequence id followed by
+    the JPEG bytes. Results are pushed back as JSON carrying the same "seq"
+    (with debug details when the URL has ?debug=1).
+    When the client sends faster than the server can infer, only the newest
+    waiting frame is kept and the skipped ones are counted in "dropped".
+    """
+    await websocket.accept()
+    client = ClientSession()  # Per-connection state, not shared with the HTTP sessions
+    debug = wants_debug(websocket)
+    latest = None  # Newest (seq, data) not yet picked up for inference
+    dropped = 0
+    closed = False
+    frame_ready = asyncio.Event()
+
+    async def receive_frames():
+        nonlocal latest, dropped, closed
+        try:
+            while True:
+                message = await websocket.receive()
+                if message["type"] == "websocket.disconnect":
+                    break
+                frame = message.get("bytes")
+                if not frame or len(frame) <= 4:
+                    continue
+                if latest is not None:
+                    dropped += 1  # Stale frame replaced before inference got to it
+                latest = (int.from_bytes(frame[:4], "big"), frame[4:])
+                frame_ready.set()
+        except WebSocketDisconnect:
+            pass
+        finally:
+            closed = True
+            frame_ready.set()
+
+    receiver = asyncio.create_task(receive_frames())
+    try:
+        while True:
+            await frame_ready.wait()
+            frame_ready.clear()
+            if closed:
+                break
+            if latest is None:
+                continue
+            (seq, data), latest = latest, None
+            skipped, dropped = dropped, 0
+
+            try:
+                load_monitor.admit()
+                timer = StageTimer()
+                async with worker_pool.slot() as frame_buffer:
+                    result = await recognize_frame(data, client, frame_buffer, debug=debug, timer=timer)
+                stages = timer.finish()
+                load_monitor.record(stages["total"])
+                metrics.observe_stages(stages)
+            except PoolSaturated:
+                result = {"error": "Server busy, frame skipped"}
+            except ModelNotReady:
+                result = {"error": "Model is still loading, frame skipped"}
+            except Exception as e:
+                logger.error("Error processing stream frame: %s", e)
+                result = {"error": f"Internal server error: {str(e)}"}
+
+            result.setdefault("capture_interval_ms", load_monitor.capture_interval_ms())
+            result["seq"] = seq
+            result["dropped"] = skipped
+            await websocket.send_text(dump_json(result).decode("utf-8"))
+    except WebSocketDisconnect:
+        pass
+    finally:
+        receiver.cancel()
+
+# ========================================
+# Bulk offline transcription
+# ========================================
+transcribe_jobs = int(os.environ.get("SILA_TRANSCRIBE_JOBS", "1"))  # Concurrent transcriptions
+transcribe_chunk = int(os.environ.get("SILA_TRANSCRIBE_CHUNK", "32"))  # Frames decoded and inferred per batch
+transcribe_max_bytes = int(os.environ.get("SILA_TRANSCRIBE_MAX_BYTES", str(512 * 1024 * 1024)))  # Upload size cap
+transcribe_spool_bytes = 8 * 1024 * 1024  # Uploads beyond this are spooled to disk
+IMAGE_SUFFIXES = (".jpg", ".jpeg", ".png", ".bmp", ".webp")
+transcription_slots = asyncio.Semaphore(max(1, transcribe_jobs))
+
+
+class UploadRejected(Exception):
+    """An upload the transcription endpoint can't use; carries the HTTP status"""
+
+    def __init__(self, status_code, message):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+def draft_reduce(img, target):
+    """Downscale by the largest power of 2 that keeps both sides >= target, like JPEG draft mode"""
+    for factor in (8, 4, 2):
+        if img.width // factor >= target and img.height // factor >= target:
+            return img.reduce(factor)
+    return img
+
+
+def decode_video_frame(rgb, tracker, size=64):
+    """What decode_grayscale / decode_hand_crop produce, for an already decoded RGB video frame"""
+    img = Image.fromarray(rgb)
+    if roi_enabled:
+        return crop_hand(np.asarray(draft_reduce(img, roi_analysis_size).convert("YCbCr")), tracker, size)
+    return np.asarray(draft_reduce(img, size).convert("L").resize((size, size)))
+
+
+def archive_frames(upload, fps, decode):
+    """(timestamp_ms, gray) for each image in a zip archive, in file name order"""
+    with zipfile.ZipFile(upload) as archive:
+        names = sorted(name for name in archive.namelist() if name.lower().endswith(IMAGE_SUFFIXES))
+        for index, name in enumerate(names):
+            yield index * 1000.0 / fps, decode(archive.read(name))
+
+
+def multipart_frames(body, boundary, fps, decode, chunk_size=64 * 1024):
+    """(timestamp_ms, gray) for each file part of a spooled multipart body, in upload order.
+
+    The body is parsed as it is read, so memory holds one chunk and the part
+    being read, never the whole form. Parts over transcribe_spool_bytes come
+    through as empty frames, which decode then reports as unreadable.
+    """
+    finished = []  # File parts completed by the last chunk fed to the parser
+    current = None  # The file part being read: a bytearray, False once too large, None for form fields
+    header_field = header_value = b""
+
+    def on_part_begin():
+        nonlocal current
+        current = None
+
+    def on_header_field(data, start, end):
+        nonlocal header_field
+        header_field += data[start:end]
+
+    def on_header_value(data, start, end):
+        nonlocal header_value
+        header_value += data[start:end]
+
+    def on_header_end():
+        nonlocal current, header_field, header_value
+        if header_field.lower() == b"content-disposition" and b"filename" in parse_options_header(header_value)[1]:
+            current = bytearray()
+        header_field = header_value = b""
+
+    def on_part_data(data, start, end):
+        nonlocal current
+        if isinstance(current, bytearray):
+            if len(current) + end - start > transcribe_spool_bytes:
+                current = False
+            else:
+                current.extend(data[start:end])
+
+    def on_part_end():
+        if current is not None:
+            finished.append(bytes(current) if current else b"")
+
+    parser = MultipartParser(boundary, {
+        "on_part_begin": on_part_begin, "on_part_data": on_part_data, "on_part_end": on_part_end,
+        "on_header_field": on_header_field, "on_header_value": on_header_value, "on_header_end": on_header_end,
+    })
+    index = 0
+    while True:
+        chunk = body.read(chunk_size)
+        if chunk:
+            parser.write(chunk)
+        else:
+            parser.finalize()
+        for data in finished:
+            yield index * 1000.0 / fps, decode(data)
+            index += 1
+        finished.clear()
+        if not chunk:
+            return
+
+
+def video_frames(path, fps, tracker):
+    """(timestamp_ms, gray) sampled from a video file at about fps frames per second"""
+    import cv2  # Needs the optional opencv-python package
+    capture = cv2.VideoCapture(path)
+    if not capture.isOpened():
+        raise ValueError("Could not open the video")
+    interval = 1000.0 / fps
+    next_at = 0.0
+    try:
+        # grab() without retrieve() skips decoding the frames the sampling drops
+        while capture.grab():
+            timestamp = capture.get(cv2.CAP_PROP_POS_MSEC)
+            if timestamp + 0.5 < next_at:
+                continue
+            next_at = max(next_at + interval, timestamp)
+            ok, frame = capture.retrieve()
+            if not ok:
+                break
+            yield timestamp, decode_video_frame(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB), tracker)
+    finally:
+        capture.release()
+
+
+async def spool_body(request, spool):
+    """Copy the request body into spool chunk by chunk, without holding it all in memory"""
+    try:
+        declared = int(request.headers.get("content-length", "0"))
+    except ValueError:
+        raise UploadRejected(400, "Invalid Content-Length")
+    if declared > transcribe_max_bytes:
+        raise UploadRejected(413, "Upload too large")
+    size = 0
+    async for chunk in request.stream():
+        size += len(chunk)
+        if size > transcribe_max_bytes:
+            raise UploadRejected(413, "Upload too large")
+        spool.write(chunk)
+    spool.flush()
+    spool.seek(0)
+
+
+async def open_frames(request, client, fps, cleanup):
+    """Frame iterator for the upload's content type; appends closers for temporary files to cleanup"""
+    tracker = client.hand_tracker
+
+    def decode(data):
+        # An unreadable frame is skipped and reported (as None) rather than ending the transcription
+        try:
+            return decode_hand_crop(data, tracker) if roi_enabled else decode_grayscale(data)
+        except Exception as e:
+            logger.warning("⚠️  Skipping undecodable frame: %s", e)
+            return None
+
+    content_type, options = parse_options_header(request.headers.get("content-type", ""))
+    content_type = content_type.decode("latin-1").lower()
+    if content_type == "multipart/form-data":
+        boundary = options.get(b"boundary")
+        if not boundary:
+            raise UploadRejected(400, "Multipart upload without a boundary")
+        spool = tempfile.SpooledTemporaryFile(max_size=transcribe_spool_bytes)
+        cleanup.append(spool.close)
+        await spool_body(request, spool)
+        return multipart_frames(spool, boundary, fps, decode)
+
+    if content_type in ("application/zip", "application/x-zip-compressed"):
+        spool = tempfile.SpooledTemporaryFile(max_size=transcribe_spool_bytes)
+        cleanup.append(spool.close)
+        await spool_body(request, spool)
+        if not zipfile.is_zipfile(spool):
+            raise UploadRejected(400, "Not a zip archive")
+        return archive_frames(spool, fps, decode)
+
+    if content_type.startswith("video/"):
+        try:
+            import cv2  # noqa: F401
+        except ImportError:
+            raise UploadRejected(415, "Video input needs the opencv-python package; upload a zip of frames instead")
+        # OpenCV reads videos from a path
+        spool = tempfile.NamedTemporaryFile(suffix=".video", delete=False)
+        cleanup.append(lambda: os.unlink(spool.name))
+        cleanup.append(spool.close)
+        await spool_body(request, spool)
+        spool.close()
+        return video_frames(spool.name, fps, tracker)
+
+    raise UploadRejected(415, f"Unsupported content type: {content_type or 'none'}")
+
+
+def take(frames, count):
+    """Pull up to count items from an iterator; runs on a worker thread, since this is where frames decode"""
+    return list(itertools.islice(frames, count))
+
+
+async def transcribe_frames(frames, client):
+    """Yield one result per (timestamp_ms, gray) frame, then a summary with the collapsed transcript.
+
+    Frames are decoded transcribe_chunk at a time on a worker thread, the next
+    chunk decoding while the current one is inferred, so memory holds two
+    chunks however long the recording is. Each chunk gets one batched
+    inference call; every frame then goes through recognize_frame in order,
+    with the same frame cache, calibration, fallback sweep, stabilizer and
+    word decoder as a live client. Frames that complete a word carry it as
+    "word"; the summary lists every decoded word. Frames that failed to
+    decode (gray None) get an "error" line and are counted as skipped.
+    """
+    frame_buffer = np.empty((1, 1, 64, 64), dtype=np.float32)
+    decoder = client.word_decoder
+    transcript = []
+    words = []
+    index = 0
+    skipped = 0
+    pending = asyncio.ensure_future(worker_pool.run(take, frames, transcribe_chunk))
+    try:
+        while True:
+            chunk = await pending
+            if not chunk:
+                break
+            pending = asyncio.ensure_future(worker_pool.run(take, frames, transcribe_chunk))
+            decoded = [gray for _, gray in chunk if gray is not None]
+            prefetched = await prefetch_predictions(decoded, client) if decoded else None
+            position = 0
+            for timestamp, gray in chunk:
+                if gray is None:
+                    yield {"t": round(timestamp, 1), "frame": index, "error": "Could not decode frame"}
+                    skipped += 1
+                    index += 1
+                    continue
+                result = await recognize_frame(None, client, frame_buffer, gray=gray,
+                                               prefetched=prefetched[position] if prefetched else None)
+                position += 1
+                text = result.get("text", "")
+                if "class" in result and not text.startswith(UNKNOWN_TEXT) and (not transcript or transcript[-1] != text):
+                    transcript.append(text)
+                line = {"t": round(timestamp, 1), "frame": index, "text": text,
+                        "confidence": result.get("confidence"), "class": result.get("class")}
+                if decoder is not None and decoder.words_committed > len(words):
+                    line["word"] = decoder.committed[-1]
+                    words.append(line["word"])
+                yield line
+                index += 1
+        summary = {"done": True, "frames": index, "skipped": skipped, "transcript": "".join(transcript)}
+        if decoder is not None:
+            decoder.commit()
+            if decoder.words_committed > len(words):
+                words.append(decoder.committed[-1])
+            summary["words"] = words
+        yield summary
+    finally:
+        # A generator can't be closed while a worker thread is running it
+        try:
+            await pending
+        except Exception:
+            pass
+        frames.close()
+
+
+@app.post("/api/sign/transcribe")
+async def transcribe(request: Request, fps: float = 10.0):
+    """Transcribe a recorded session: a video, a zip of frames or multipart frame uploads.
+
+    Streams NDJSON: one {"t", "frame", "text", "confidence", "class"} line per
+    frame as soon as it is recognized (plus "word" on frames that complete
+    one), or {"t", "frame", "error"} for a frame that can't be decoded, then
+    {"done", "frames", "skipped", "transcript", "words"}.
+    fps is the sampling rate for videos and sets the timestamps of frame files.
+    """
+    if model_state["status"] not in ("ready", "failed"):
+        return JSONResponse(status_code=503, headers={"Retry-After": "1"},
+                            content={"error": "Model is still loading, please retry shortly"})
+    if fps <= 0:
+        return JSONResponse(status_code=400, content={"error": "fps must be positive"})
+    if transcription_slots.locked():
+        return JSONResponse(status_code=503, headers={"Retry-After": "5"},
+                            content={"error": "Another transcription is running, please retry shortly"})
+
+    await transcription_slots.acquire()
+    cleanup = []
+
+    released = False
+
+    async def release():
+        # Runs from the stream's finally and as the response's background task,
+        # whichever comes first; a disconnected client can leave the stream unfinished
+        nonlocal released
+        if released:
+            return
+        released = True
+        for close in reversed(cleanup):
+            try:
+                if asyncio.iscoroutinefunction(close):
+                    await close()
+                else:
+                    close()
+            except OSError:
+                pass
+        transcription_slots.release()
+
+    client = ClientSession()
+    try:
+        frames = await open_frames(request, client, fps, cleanup)
+    except UploadRejected as e:
+        await release()
+        return JSONResponse(status_code=e.status_code, content={"error": str(e)})
+    except Exception as e:
+        await release()
+        logger.error("Error reading transcription upload: %s", e)
+        return JSONResponse(status_code=400, content={"error": f"Could not read upload: {str(e)}"})
+
+    async def stream():
+        try:
+            async for line in transcribe_frames(frames, client):
+                yield dump_json(line) + b"\n"
+        except Exception as e:
+            logger.error("Error during transcription: %s", e)
+            yield dump_json({"error": f"Transcription failed: {str(e)}"}) + b"\n"
+        finally:
+            await release()
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson", background=BackgroundTask(release))
+
 @app.post("/api/sign/recognize-debug")
 async def recognize_sign_debug(request: Request):
     """Debug endpoint to see what's being received"""
@@ -513,16 +3123,100 @@ async def recognize_sign_debug(request: Request):
     except Exception as e:
         return {"error": str(e)}
 
+# ========================================
+# Multi-worker serving
+# ========================================
+server_workers = int(os.environ.get("SILA_WORKERS", "1"))  # Processes serving the API
+
+
+def bind_socket(host, port):
+    sock = socket.socket(socket.AF_INET6 if ":" in host else socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    return sock
+
+
+def serve(host="127.0.0.1", port=8010, workers=server_workers):
+    """Run the API, pre-forking `workers` processes that share one listening socket.
+
+    The parent creates the shared session and metrics tables, the INT8 copy
+    of the model if asked for, and the split weights file before forking.
+    Every worker then builds its own sessions in its lifespan, all mapping
+    that one weights file; see SessionPool. Systems without fork() fall back
+    to uvicorn's spawned workers, which keep their own session state and
+    metrics.
+    """
+    global shared_stabilizers, session_pool_size, metrics
+    if workers <= 1:
+        uvicorn.run(app, host=host, port=port, log_level="info")
+        return
+    if not hasattr(os, "fork"):
+        logger.warning("⚠️  fork() unavailable: starting %d spawned workers, each with its own session state", workers)
+        uvicorn.run("backend:app", host=host, port=port, workers=workers, log_level="info")
+        return
+
+    if "SILA_SESSION_POOL_SIZE" not in os.environ:
+        # Split the cores between workers instead of giving each one a full pool
+        session_pool_size = max(1, session_pool_size // workers)
+    # Quantize and split the weights once here instead of every worker racing to write the same files
+    serving_path = resolve_serving_path()
+    if share_weights and serving_path.endswith(".onnx"):
+        try:
+            ensure_shared_weights(serving_path)
+        except Exception as e:
+            logger.warning("⚠️  Weight sharing unavailable (%s), every session loads its own copy", e)
+    shared_stabilizers = SharedStabilizerTable()
+    metrics = Metrics(workers)
+    sock = bind_socket(host, port)
+    logger.info("🚀 Starting %d workers on http://%s:%d (%d session(s) each)", workers, host, port, session_pool_size)
+
+    children = []
+    for index in range(workers):
+        pid = os.fork()
+        if pid == 0:
+            metrics.select_worker(index)
+            server = uvicorn.Server(uvicorn.Config(app, log_level="info"))
+            try:
+                server.run(sockets=[sock])
+            finally:
+                logging.shutdown()
+                os._exit(0)
+        children.append(pid)
+
+    def stop_workers(signum, frame):
+        for child in children:
+            try:
+                os.kill(child, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGINT, stop_workers)
+    signal.signal(signal.SIGTERM, stop_workers)
+    for child in children:
+        while True:
+            try:
+                os.waitpid(child, 0)
+                break
+            except ChildProcessError:
+                break
+            except InterruptedError:
+                continue
+    sock.close()
+
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sila Sign Language Recognition API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8010)
+    parser.add_argument("--workers", type=int, default=server_workers, help="Worker processes (default: SILA_WORKERS or 1)")
+    args = parser.parse_args()
+
     print("Starting Sila Sign Language Recognition API...")
     print("Frontend should be running on http://localhost:8000")
-    print("Backend will be available on http://127.0.0.1:8010")
-    print("API endpoint: http://127.0.0.1:8010/api/sign/recognize")
+    print(f"Backend will be available on http://{args.host}:{args.port}")
+    print(f"API endpoint: http://{args.host}:{args.port}/api/sign/recognize")
     print("\nPress Ctrl+C to stop the server")
-    
-    uvicorn.run(
-        app, 
-        host="127.0.0.1", 
-        port=8010,
-        log_level="info"
-    )
\ No newline at end of file
+
+    serve(args.host, args.port, args.workers)
@@ -0,0 +1,87 @@
+"""Throughput vs. p99 latency for ONNX inference with micro-batching on and off.
+
+Simulates many browsers by running concurrent client threads that each send
+one [1, 1, 64, 64] frame at a time and wait for the answer. Without
+assets/model.onnx it runs the synthetic stand-in model from load_benchmark.py
+(needs the optional onnx package).
+
+Usage:
+    python benchmarks/batching_benchmark.py --model assets/model.onnx --concurrency 32
+"""
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+
+import numpy as np
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, REPO_DIR)
+sys.path.insert(0, BENCH_DIR)
+from backend import InferenceBatcher, SessionPool  # noqa: E402
+from load_benchmark import build_standin_model  # noqa: E402
+
+
+def run_clients(infer, concurrency, requests_per_client):
+    """Run concurrent clients and return (elapsed seconds, per-request latencies)"""
+    latencies = [[] for _ in range(concurrency)]
+    barrier = threading.Barrier(concurrency + 1)
+
+    def client(idx):
+        frame = np.random.uniform(-1, 1, (1, 1, 64, 64)).astype(np.float32)
+        barrier.wait()
+        for _ in range(requests_per_client):
+            start = time.perf_counter()
+            infer(frame)
+            latencies[idx].append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(concurrency)]
+    for t in threads:
+        t.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+    return elapsed, np.concatenate([np.array(lat) for lat in latencies])
+
+
+def report(label, elapsed, latencies):
+    total = len(latencies)
+    p50, p99 = np.percentile(latencies, (50, 99)) * 1000
+    print(f"{label:<28} {total / elapsed:>10.1f} req/s   p50 {p50:>7.2f} ms   p99 {p99:>7.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model", default=os.path.join(REPO_DIR, "assets", "model.onnx"))
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=200, help="requests per client")
+    parser.add_argument("--batch-sizes", default="4,8,16,32", help="comma-separated max batch sizes to try")
+    parser.add_argument("--wait-ms", type=float, default=5.0)
+    parser.add_argument("--sessions", type=int, default=1, help="pooled sessions (SILA_SESSION_POOL_SIZE)")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.model):
+        args.model = build_standin_model(os.path.join(tempfile.mkdtemp(prefix="sila-bench-"), "standin.onnx"))
+        print(f"Model not found, using synthetic stand-in model {args.model}")
+    pool = SessionPool(args.model, size=args.sessions)
+    batch_sizes = [int(s) for s in args.batch_sizes.split(",")]
+    # Warm up so the first measured run doesn't pay for allocator growth
+    pool.warm_up(sorted({1, *batch_sizes}))
+
+    print(f"model={args.model} sessions={args.sessions} concurrency={args.concurrency} requests/client={args.requests}")
+    elapsed, latencies = run_clients(pool.run, args.concurrency, args.requests)
+    report("batching off", elapsed, latencies)
+
+    for size in batch_sizes:
+        batcher = InferenceBatcher(pool, max_batch_size=size, max_wait_ms=args.wait_ms)
+        elapsed, latencies = run_clients(batcher.run, args.concurrency, args.requests)
+        report(f"batching on (max {batcher.max_batch_size}, {args.wait_ms:g}ms)", elapsed, latencies)
+
+
+if __name__ == "__main__":
+    main()
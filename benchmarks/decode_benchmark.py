@@ -0,0 +1,97 @@
+"""Per-frame decode + preprocess time: legacy RGB path vs. draft-mode grayscale path.
+
+The legacy path is what recognize_sign used to do: decode to full RGB,
+convert to "L", resize to 64x64 and preprocess into a fresh array. The fast
+path is decode_grayscale + preprocess_image_optimized writing into a reused
+buffer. Both share the same normalization code, so the gap is the decode.
+The hand ROI path (SILA_ROI=1) adds the YCbCr draft decode, mask and crop.
+
+Usage:
+    python benchmarks/decode_benchmark.py                    # synthetic 320x240 frames
+    python benchmarks/decode_benchmark.py --frames path/to/jpegs
+"""
+import argparse
+import glob
+import io
+import os
+import sys
+import time
+
+import numpy as np
+from PIL import Image
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from backend import HandTracker, decode_grayscale, decode_hand_crop, preprocess_image_optimized  # noqa: E402
+
+
+def legacy_path(data, size=64):
+    img = Image.open(io.BytesIO(data)).convert("RGB")
+    gray = np.asarray(img.convert("L").resize((size, size)))
+    return preprocess_image_optimized(gray, size)[0]
+
+
+def fast_path(data, buffer, size=64):
+    return preprocess_image_optimized(decode_grayscale(data, size), size, buffer)[0]
+
+
+def roi_path(data, buffer, tracker, size=64):
+    return preprocess_image_optimized(decode_hand_crop(data, tracker, size), size, buffer)[0]
+
+
+def synthetic_frames(count, width=320, height=240, quality=70):
+    """JPEGs shaped like the browser's TARGET_WIDTH captures"""
+    rng = np.random.default_rng(0)
+    frames = []
+    for _ in range(count):
+        # Smooth gradients plus noise compress more like camera frames than pure noise
+        y, x = np.mgrid[0:height, 0:width]
+        base = (x * rng.uniform(0.2, 0.8) + y * rng.uniform(0.2, 0.8)) % 255
+        rgb = np.clip(base[..., None] + rng.normal(0, 12, (height, width, 3)), 0, 255).astype(np.uint8)
+        buf = io.BytesIO()
+        Image.fromarray(rgb).save(buf, "JPEG", quality=quality)
+        frames.append(buf.getvalue())
+    return frames
+
+
+def time_per_frame(fn, frames, repeats):
+    timings = []
+    for _ in range(repeats):
+        for data in frames:
+            start = time.perf_counter()
+            fn(data)
+            timings.append(time.perf_counter() - start)
+    return np.array(timings) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", help="directory of .jpg/.jpeg frames (default: synthetic)")
+    parser.add_argument("--count", type=int, default=50, help="synthetic frame count")
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+
+    if args.frames:
+        paths = sorted(glob.glob(os.path.join(args.frames, "*.jp*g")))
+        frames = [open(p, "rb").read() for p in paths]
+    else:
+        frames = synthetic_frames(args.count)
+    if not frames:
+        sys.exit("No frames found")
+
+    buffer = np.empty((1, 1, 64, 64), dtype=np.float32)
+    diff = np.abs(legacy_path(frames[0]) - fast_path(frames[0], buffer)).mean()
+    print(f"{len(frames)} frames x {args.repeats} repeats, mean |legacy - fast| on frame 0: {diff:.4f}")
+
+    tracker = HandTracker()
+    paths = (
+        ("legacy RGB path", legacy_path),
+        ("draft grayscale path", lambda d: fast_path(d, buffer)),
+        ("hand ROI path", lambda d: roi_path(d, buffer, tracker)),
+    )
+    for label, fn in paths:
+        us = time_per_frame(fn, frames, args.repeats)
+        print(f"{label:<22} mean {us.mean():>8.1f} us   p50 {np.percentile(us, 50):>8.1f} us   p99 {np.percentile(us, 99):>8.1f} us")
+
+
+if __name__ == "__main__":
+    main()
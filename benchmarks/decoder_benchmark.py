@@ -0,0 +1,82 @@
+"""Per-frame cost of the letter-to-word decoder as a session gets longer.
+
+Replays a synthetic signing session: lexicon words spelled letter by letter,
+each letter held for a few frames, with pauses between words, and some
+letters confused with a neighbouring class. The mean WordDecoder.observe cost
+is reported per window of frames; it should stay flat however long the
+session runs, since each frame only touches the beam, not the history.
+
+Usage:
+    python benchmarks/decoder_benchmark.py
+    python benchmarks/decoder_benchmark.py --frames 200000 --window 20000 --beam 16
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+os.chdir(REPO_DIR)  # The lexicon path is relative to the repo root
+
+
+def synthetic_session(backend, frames, rng, hold=4, pause=20, confusion=0.2):
+    """(stable_class or None, model output row) per frame, spelling random lexicon words"""
+    label_classes = {}
+    for cls, label in enumerate(backend.class_labels):
+        label_classes.setdefault(backend.normalize_letters(label), cls)
+    words = [node_word for node_word in backend.lexicon.word if node_word]
+    num_classes = len(backend.class_labels)
+    stream = []
+    while len(stream) < frames:
+        word = backend.normalize_letters(words[rng.integers(len(words))])
+        for char in word:
+            cls = label_classes.get(char)
+            if cls is None:
+                continue
+            row = np.full((1, num_classes), 0.1 / num_classes, dtype=np.float32)
+            row[0, cls] = 0.6
+            if rng.random() < confusion:
+                # The model prefers a wrong class; the right one is second
+                wrong = int(rng.integers(num_classes))
+                row[0, wrong] = 0.7
+                cls = wrong
+            stream.extend([(cls, row)] * hold)
+        idle = np.full((1, num_classes), 1.0 / num_classes, dtype=np.float32)
+        stream.extend([(None, idle)] * pause)
+    return stream[:frames]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, default=100000, help="session length in frames")
+    parser.add_argument("--window", type=int, default=10000, help="frames per reported window")
+    parser.add_argument("--beam", type=int, help="beam width (default: SILA_DECODER_BEAM)")
+    args = parser.parse_args()
+
+    import backend
+    if backend.lexicon is None:
+        sys.exit(f"No lexicon at {backend.lexicon_path}")
+    if args.beam:
+        backend.decoder_beam_width = args.beam
+
+    stream = synthetic_session(backend, args.frames, np.random.default_rng(0))
+    decoder = backend.WordDecoder()
+    print(f"{args.frames} frames, beam {backend.decoder_beam_width}, {backend.decoder_candidates} candidates per letter")
+    print(f"{'frames':>10} {'mean us/frame':>14} {'p99 us':>8} {'words':>8}")
+    timings = np.empty(args.window)
+    for start in range(0, args.frames, args.window):
+        window = stream[start:start + args.window]
+        for i, (cls, row) in enumerate(window):
+            begin = time.perf_counter()
+            decoder.observe(cls, row)
+            timings[i] = time.perf_counter() - begin
+        used = timings[:len(window)] * 1e6
+        print(f"{start + len(window):>10} {used.mean():>14.2f} {np.percentile(used, 99):>8.2f} {decoder.words_committed:>8}")
+    print(f"last words: {' '.join(decoder.committed)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,302 @@
+"""Load and latency benchmark for /api/sign/recognize.
+
+Replays a corpus of JPEG frames against the recognition endpoint, either
+in-process (the FastAPI app is driven directly, no sockets) or against a
+running server over HTTP. Each concurrent worker acts as one browser with its
+own X-Session-ID. Reports throughput, p50/p95/p99 latency, status codes and
+per-stage timings, and can save the results as JSON and compare them with an
+earlier run to catch performance regressions.
+
+When assets/model.onnx is missing, in-process runs use a tiny synthetic
+stand-in model (needs the optional onnx package), so the harness measures the
+serving path even without the trained weights.
+
+Usage:
+    python benchmarks/load_benchmark.py --concurrency 16 --duration 20 --output results.json
+    python benchmarks/load_benchmark.py --frames path/to/jpegs --rate 200 --compare results.json
+    python benchmarks/load_benchmark.py --url http://127.0.0.1:8010 --concurrency 32
+    python benchmarks/load_benchmark.py --format tensor   # raw uint8 tensors instead of JPEGs
+"""
+import argparse
+import asyncio
+import glob
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, REPO_DIR)
+sys.path.insert(0, BENCH_DIR)
+
+ENDPOINT = "/api/sign/recognize"
+
+
+def build_standin_model(path, num_classes=32):
+    """Write a tiny [batch, 1, 64, 64] -> [batch, num_classes] softmax classifier"""
+    import onnx
+    from onnx import TensorProto, helper, numpy_helper
+
+    rng = np.random.default_rng(0)
+    weights = numpy_helper.from_array(rng.normal(0, 0.05, (16 * 16, num_classes)).astype(np.float32), "W")
+    bias = numpy_helper.from_array(np.zeros(num_classes, dtype=np.float32), "B")
+    nodes = [
+        helper.make_node("AveragePool", ["input"], ["pooled"], kernel_shape=[4, 4], strides=[4, 4]),
+        helper.make_node("Flatten", ["pooled"], ["flat"], axis=1),
+        helper.make_node("Gemm", ["flat", "W", "B"], ["logits"]),
+        helper.make_node("Softmax", ["logits"], ["output"], axis=1),
+    ]
+    graph = helper.make_graph(
+        nodes, "sila-standin",
+        [helper.make_tensor_value_info("input", TensorProto.FLOAT, ["batch", 1, 64, 64])],
+        [helper.make_tensor_value_info("output", TensorProto.FLOAT, ["batch", num_classes])],
+        [weights, bias],
+    )
+    model = helper.make_model(graph, opset_imports=[helper.make_opsetid("", 13)])
+    model.ir_version = 8
+    onnx.save(model, path)
+    return path
+
+
+def load_frames(frames_dir, count):
+    if frames_dir:
+        paths = sorted(glob.glob(os.path.join(frames_dir, "*.jp*g")))
+        return [open(p, "rb").read() for p in paths]
+    from decode_benchmark import synthetic_frames
+    return synthetic_frames(count)
+
+
+def parse_server_timing(header):
+    """'decode;dur=1.2, infer;dur=3.4' -> {'decode': 1.2, 'infer': 3.4} (milliseconds)"""
+    stages = {}
+    for part in header.split(","):
+        name, _, params = part.strip().partition(";")
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "dur":
+                try:
+                    stages[name] = float(value)
+                except ValueError:
+                    pass
+    return stages
+
+
+def summarize(values_ms):
+    values = np.asarray(values_ms, dtype=np.float64)
+    if values.size == 0:
+        return None
+    p50, p95, p99 = np.percentile(values, (50, 95, 99))
+    return {"count": int(values.size), "mean": float(values.mean()), "p50": float(p50),
+            "p95": float(p95), "p99": float(p99), "max": float(values.max())}
+
+
+async def run_load(client, frames, concurrency, duration, rate, warmup, content_type="image/jpeg"):
+    """Drive the endpoint with `concurrency` workers; open-loop at `rate` req/s when rate > 0"""
+    latencies, statuses, stage_samples = [], {}, {}
+    start = time.perf_counter()
+    measure_from = start + warmup
+    stop_at = measure_from + duration
+    next_slot = [start]
+
+    async def worker(idx):
+        headers = {"Content-Type": content_type, "X-Session-ID": f"bench-{idx}"}
+        i = idx
+        while True:
+            if rate > 0:
+                # Claim the next send slot on the shared schedule; latency counts from the slot,
+                # so a slow server can't hide its queueing delay (coordinated omission)
+                scheduled = next_slot[0]
+                next_slot[0] += 1.0 / rate
+                if scheduled >= stop_at:
+                    return
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            else:
+                scheduled = time.perf_counter()
+                if scheduled >= stop_at:
+                    return
+
+            frame = frames[i % len(frames)]
+            i += concurrency
+            try:
+                response = await client.post(ENDPOINT, content=frame, headers=headers)
+                status = response.status_code
+                timing = response.headers.get("server-timing")
+            except Exception as e:
+                status, timing = type(e).__name__, None
+            done = time.perf_counter()
+            # In-process, a fast rejection never suspends; yield so requests holding a slot can finish
+            await asyncio.sleep(0)
+
+            if scheduled < measure_from:
+                continue
+            statuses[str(status)] = statuses.get(str(status), 0) + 1
+            if status == 200:
+                latencies.append((done - scheduled) * 1000)
+                if timing:
+                    for stage, ms in parse_server_timing(timing).items():
+                        stage_samples.setdefault(stage, []).append(ms)
+
+    await asyncio.gather(*(worker(i) for i in range(concurrency)))
+    elapsed = time.perf_counter() - measure_from
+    return {
+        "elapsed_s": elapsed,
+        "requests": sum(statuses.values()),
+        "throughput_rps": len(latencies) / elapsed if elapsed > 0 else 0.0,
+        "status_counts": statuses,
+        "latency_ms": summarize(latencies),
+        "server_timing_ms": {stage: summarize(ms) for stage, ms in sorted(stage_samples.items())},
+    }
+
+
+def profile_stages(backend, frames, samples=50):
+    """Time each pipeline stage directly on up to `samples` frames (in-process only)"""
+    timings = {"decode": [], "preprocess": [], "inference": [], "fallback_sweep": []}
+    buffer = np.empty((1, 1, 64, 64), dtype=np.float32)
+    for data in frames[:samples]:
+        t0 = time.perf_counter()
+        gray = backend.decode_grayscale(data)
+        t1 = time.perf_counter()
+        img_array, _ = backend.preprocess_image_optimized(gray, 64, buffer)
+        t2 = time.perf_counter()
+        backend.session_pool.run(img_array)
+        t3 = time.perf_counter()
+        backend.session_pool.run(backend.build_fallback_batch(gray, 64))
+        t4 = time.perf_counter()
+        timings["decode"].append((t1 - t0) * 1000)
+        timings["preprocess"].append((t2 - t1) * 1000)
+        timings["inference"].append((t3 - t2) * 1000)
+        timings["fallback_sweep"].append((t4 - t3) * 1000)
+    return {stage: summarize(ms) for stage, ms in timings.items()}
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_DIR,
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except Exception:
+        return None
+
+
+def compare(current, baseline, tolerance):
+    """Print deltas against a saved run; returns False if anything regressed past tolerance"""
+    ok = True
+    rows = [("throughput_rps", current["throughput_rps"], baseline["throughput_rps"], True)]
+    for key in ("p50", "p95", "p99"):
+        if current["latency_ms"] and baseline.get("latency_ms"):
+            rows.append((f"latency {key} (ms)", current["latency_ms"][key], baseline["latency_ms"][key], False))
+
+    print(f"\nComparison with {baseline.get('git_revision') or 'baseline'} (tolerance {tolerance * 100:.0f}%):")
+    for label, now, before, higher_is_better in rows:
+        change = (now - before) / before if before else 0.0
+        regressed = change < -tolerance if higher_is_better else change > tolerance
+        ok = ok and not regressed
+        print(f"  {label:<18} {before:>10.2f} -> {now:>10.2f}  ({change * 100:+.1f}%){'  REGRESSION' if regressed else ''}")
+    return ok
+
+
+def print_report(results):
+    latency = results["latency_ms"]
+    print(f"\nmode={results['mode']} model={results['model']} concurrency={results['concurrency']} "
+          f"rate={results['rate'] or 'max'} duration={results['duration_s']}s format={results.get('format', 'jpeg')}")
+    print(f"requests: {results['requests']}  status: {results['status_counts']}")
+    print(f"throughput: {results['throughput_rps']:.1f} req/s")
+    if latency:
+        print(f"latency ms: p50 {latency['p50']:.2f}  p95 {latency['p95']:.2f}  p99 {latency['p99']:.2f}  max {latency['max']:.2f}")
+    for title, stages in (("server timing", results["server_timing_ms"]), ("stage profile", results.get("stage_profile_ms"))):
+        if stages:
+            print(f"{title} (ms):")
+            for stage, s in stages.items():
+                if s:
+                    print(f"  {stage:<16} mean {s['mean']:>8.3f}  p50 {s['p50']:>8.3f}  p99 {s['p99']:>8.3f}")
+
+
+async def main_async(args):
+    import httpx
+
+    results = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "git_revision": git_revision(),
+        "python": platform.python_version(),
+        "cpu_count": os.cpu_count(),
+        "concurrency": args.concurrency,
+        "rate": args.rate,
+        "duration_s": args.duration,
+        "env": {k: v for k, v in os.environ.items() if k.startswith("SILA_")},
+    }
+
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    if not args.url:
+        # Pick the model before anything imports backend, which reads SILA_MODEL_PATH at import time
+        model = os.environ.get("SILA_MODEL_PATH", os.path.join(REPO_DIR, "assets", "model.onnx"))
+        if not os.path.exists(model):
+            model = build_standin_model(os.path.join(tempfile.mkdtemp(prefix="sila-bench-"), "standin.onnx"))
+            print(f"assets/model.onnx not found, using synthetic stand-in model {model}")
+        os.environ["SILA_MODEL_PATH"] = model
+        import backend
+
+    frames = load_frames(args.frames, args.count)
+    if not frames:
+        sys.exit("No frames found")
+    results["frames"] = len(frames)
+    results["format"] = args.format
+    payloads, content_type = frames, "image/jpeg"
+    if args.format == "tensor":
+        # Decode once up front, as a client preprocessing on-device would
+        import backend
+        payloads = [backend.encode_tensor(backend.decode_grayscale(frame)[None]) for frame in frames]
+        content_type = backend.TENSOR_CONTENT_TYPE
+
+    if args.url:
+        results.update(mode="http", model=args.url)
+        async with httpx.AsyncClient(base_url=args.url, limits=limits, timeout=30) as client:
+            results.update(await run_load(client, payloads, args.concurrency, args.duration, args.rate, args.warmup, content_type))
+    else:
+        results.update(mode="in-process", model=model)
+        transport = httpx.ASGITransport(app=backend.app)
+        # The ASGI transport doesn't run startup, so drive the lifespan and wait for the model ourselves
+        async with backend.app.router.lifespan_context(backend.app):
+            await asyncio.to_thread(backend.model_loaded.wait)
+            results["model_state"] = dict(backend.model_state)
+            async with httpx.AsyncClient(transport=transport, base_url="http://bench", limits=limits, timeout=30) as client:
+                results.update(await run_load(client, payloads, args.concurrency, args.duration, args.rate, args.warmup, content_type))
+            if backend.session_pool is not None:
+                results["stage_profile_ms"] = profile_stages(backend, frames)
+
+    print_report(results)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nSaved results to {args.output}")
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if not compare(results, baseline, args.tolerance):
+            sys.exit(1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", help="benchmark a running server (default: in-process)")
+    parser.add_argument("--frames", help="directory of .jpg/.jpeg frames (default: synthetic)")
+    parser.add_argument("--count", type=int, default=64, help="synthetic frame count")
+    parser.add_argument("--format", choices=("jpeg", "tensor"), default="jpeg", help="upload JPEGs or raw uint8 tensors")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--rate", type=float, default=0, help="total requests/s, open loop (0 = as fast as possible)")
+    parser.add_argument("--duration", type=float, default=10, help="measured seconds")
+    parser.add_argument("--warmup", type=float, default=2, help="seconds of unmeasured warm-up")
+    parser.add_argument("--output", help="write results JSON here")
+    parser.add_argument("--compare", help="baseline results JSON; exit 1 on regression")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="allowed relative regression")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
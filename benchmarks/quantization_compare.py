@@ -0,0 +1,70 @@
+"""Accuracy and latency of the FP32 model vs. its dynamically quantized INT8 copy.
+
+Every frame goes through the same decode + preprocessing as the server, then
+through both models. Reports top-1 agreement, mean latency per frame for each
+model and the INT8 speedup. Needs the optional onnx package to quantize.
+
+Usage:
+    python benchmarks/quantization_compare.py --frames path/to/jpegs
+    python benchmarks/quantization_compare.py --model assets/model.onnx   # synthetic frames
+"""
+import argparse
+import glob
+import os
+import sys
+import time
+
+import numpy as np
+import onnxruntime as ort
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from backend import decode_grayscale, ensure_quantized_model, make_session_options, preprocess_image_optimized  # noqa: E402
+from decode_benchmark import synthetic_frames  # noqa: E402
+
+
+def timed_predictions(session, inputs, repeats):
+    """Top-1 class per input and mean seconds per input"""
+    input_name = session.get_inputs()[0].name
+    session.run(None, {input_name: inputs[0]})  # warm-up
+    classes = []
+    start = time.perf_counter()
+    for _ in range(repeats):
+        classes = [int(np.argmax(session.run(None, {input_name: x})[0])) for x in inputs]
+    elapsed = (time.perf_counter() - start) / (repeats * len(inputs))
+    return np.array(classes), elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model", default="assets/model.onnx")
+    parser.add_argument("--frames", help="directory of .jpg/.jpeg frames (default: synthetic)")
+    parser.add_argument("--count", type=int, default=100, help="synthetic frame count")
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.frames:
+        frames = [open(p, "rb").read() for p in sorted(glob.glob(os.path.join(args.frames, "*.jp*g")))]
+    else:
+        frames = synthetic_frames(args.count)
+    if not frames:
+        sys.exit("No frames found")
+    inputs = [preprocess_image_optimized(decode_grayscale(data))[0] for data in frames]
+
+    int8_path = ensure_quantized_model(args.model)
+    fp32 = ort.InferenceSession(args.model, sess_options=make_session_options())
+    int8 = ort.InferenceSession(int8_path, sess_options=make_session_options())
+
+    fp32_classes, fp32_time = timed_predictions(fp32, inputs, args.repeats)
+    int8_classes, int8_time = timed_predictions(int8, inputs, args.repeats)
+
+    size_fp32 = os.path.getsize(args.model) / 1024
+    size_int8 = os.path.getsize(int8_path) / 1024
+    print(f"frames: {len(inputs)}  ({'synthetic' if not args.frames else args.frames})")
+    print(f"FP32  {args.model:<32} {size_fp32:>9.1f} KB   {fp32_time * 1e3:>7.3f} ms/frame")
+    print(f"INT8  {int8_path:<32} {size_int8:>9.1f} KB   {int8_time * 1e3:>7.3f} ms/frame")
+    print(f"top-1 agreement: {np.mean(fp32_classes == int8_classes) * 100:.1f}%")
+    print(f"speedup: {fp32_time / int8_time:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
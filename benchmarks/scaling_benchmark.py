@@ -0,0 +1,142 @@
+"""Multi-core scaling benchmark for the pre-forked server.
+
+Starts `backend.py --workers N` for each N in --workers, drives it over HTTP
+with the load benchmark's client, and reports throughput, latency, speedup
+and parallel efficiency relative to one worker. On Linux it also reports the
+proportional set size (PSS) of all server processes, which counts pages the
+workers share (the session and metrics tables) only once.
+
+Usage:
+    python benchmarks/scaling_benchmark.py --workers 1 2 4 --concurrency 32 --duration 15
+    python benchmarks/scaling_benchmark.py --output scaling.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, BENCH_DIR)
+
+from load_benchmark import build_standin_model, load_frames, run_load
+
+
+def process_tree(pid):
+    """pid plus its children (Linux /proc only)"""
+    pids = [pid]
+    try:
+        with open(f"/proc/{pid}/task/{pid}/children") as f:
+            pids += [int(child) for child in f.read().split()]
+    except OSError:
+        pass
+    return pids
+
+
+def pss_mb(pids):
+    """Total proportional set size of pids in MB, or None where /proc is unavailable"""
+    total = 0
+    for pid in pids:
+        try:
+            with open(f"/proc/{pid}/smaps_rollup") as f:
+                for line in f:
+                    if line.startswith("Pss:"):
+                        total += int(line.split()[1])
+                        break
+        except OSError:
+            return None
+    return total / 1024
+
+
+def wait_ready(url, timeout=60):
+    import httpx
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"{url}/health/ready", timeout=2).status_code == 200:
+                return True
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    return False
+
+
+async def measure(url, frames, args):
+    import httpx
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=30) as client:
+        return await run_load(client, frames, args.concurrency, args.duration, 0, args.warmup)
+
+
+def run_workers(workers, frames, env, args):
+    url = f"http://127.0.0.1:{args.port}"
+    server = subprocess.Popen(
+        [sys.executable, os.path.join(REPO_DIR, "backend.py"), "--workers", str(workers), "--port", str(args.port)],
+        cwd=REPO_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        if not wait_ready(url):
+            sys.exit(f"Server with {workers} worker(s) did not become ready")
+        # Every worker loads its own sessions; give the others a moment after the first reports ready
+        time.sleep(1.0)
+        result = asyncio.run(measure(url, frames, args))
+        result["pss_mb"] = pss_mb(process_tree(server.pid))
+        return result
+    finally:
+        server.terminate()
+        try:
+            server.wait(timeout=15)
+        except subprocess.TimeoutExpired:
+            server.kill()
+            server.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    cores = os.cpu_count() or 1
+    default_workers = sorted({1, *(n for n in (2, 4, 8, 16) if n <= cores), cores})
+    parser.add_argument("--workers", type=int, nargs="+", default=default_workers, help="worker counts to compare")
+    parser.add_argument("--port", type=int, default=8099)
+    parser.add_argument("--frames", help="directory of .jpg/.jpeg frames (default: synthetic)")
+    parser.add_argument("--count", type=int, default=64, help="synthetic frame count")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10, help="measured seconds per worker count")
+    parser.add_argument("--warmup", type=float, default=2, help="seconds of unmeasured warm-up")
+    parser.add_argument("--output", help="write results JSON here")
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    model = env.get("SILA_MODEL_PATH", os.path.join(REPO_DIR, "assets", "model.onnx"))
+    if not os.path.exists(model):
+        model = build_standin_model(os.path.join(tempfile.mkdtemp(prefix="sila-bench-"), "standin.onnx"))
+        print(f"assets/model.onnx not found, using synthetic stand-in model {model}")
+    env["SILA_MODEL_PATH"] = os.path.abspath(model)
+    frames = load_frames(args.frames, args.count)
+
+    results = {"cpu_count": cores, "concurrency": args.concurrency, "duration_s": args.duration, "runs": {}}
+    for workers in args.workers:
+        print(f"Measuring {workers} worker(s)...")
+        results["runs"][workers] = run_workers(workers, frames, env, args)
+
+    base = results["runs"][args.workers[0]]["throughput_rps"] or 1.0
+    print(f"\n{'workers':>8} {'req/s':>10} {'speedup':>8} {'eff.':>6} {'p50 ms':>8} {'p99 ms':>8} {'PSS MB':>8}")
+    for workers, run in results["runs"].items():
+        speedup = run["throughput_rps"] / base
+        run["speedup"] = speedup
+        latency = run["latency_ms"] or {"p50": float("nan"), "p99": float("nan")}
+        pss = f"{run['pss_mb']:.0f}" if run["pss_mb"] is not None else "n/a"
+        print(f"{workers:>8} {run['throughput_rps']:>10.1f} {speedup:>7.2f}x {speedup / workers * args.workers[0]:>6.0%} "
+              f"{latency['p50']:>8.2f} {latency['p99']:>8.2f} {pss:>8}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nSaved results to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,12 @@ let isMobileMenuOpen = false;
 
 // Backend endpoint (change if your port/domain is different)
 const API_URL = 'http://127.0.0.1:8010/api/sign/recognize';
+const WS_URL = 'ws://127.0.0.1:8010/ws/sign/recognize';
+
+// Per-tab session id so the backend keeps separate stabilization state for each camera feed
+const SIGN_SESSION_ID = (window.crypto && crypto.randomUUID)
+    ? crypto.randomUUID()
+    : `${Date.now().toString(36)}-${Math.random().toString(36).slice(2)}`;
 
 // DOM Content Loaded
 document.addEventListener('DOMContentLoaded', function() {
@@ -743,12 +749,37 @@ function stopCamera() {
 }
 
 // Sign Recognition Streaming
-let signRecognitionIntervalId = null;
+let signRecognitionTimerId = null;
+let signRecognitionRun = 0; // Bumped on stop so a capture still in progress doesn't reschedule itself
+let signRecognitionSocket = null;
 let offscreenCanvas = null;
 let offscreenCtx = null;
 
+// Starting polling interval (ms) for the HTTP fallback
+const CAPTURE_INTERVAL_MS = 500; // 2 FPS (500ms between captures)
+// Starting streaming interval (ms) when the WebSocket endpoint is available
+const STREAM_INTERVAL_MS = 80; // ~12 FPS
+// Every response carries capture_interval_ms, the pace the server asks for; keep it within these bounds
+const MIN_CAPTURE_INTERVAL_MS = 50;
+const MAX_CAPTURE_INTERVAL_MS = 5000;
+const MAX_FRAMES_IN_FLIGHT = 2; // Don't queue more frames than the server can keep up with
+const TARGET_WIDTH = 320; // downscale for bandwidth; backend should accept this
+let captureIntervalMs = CAPTURE_INTERVAL_MS;
+
+function applyPacingHint(result) {
+    const hint = Number(result && result.capture_interval_ms);
+    if (hint > 0) {
+        captureIntervalMs = Math.min(Math.max(hint, MIN_CAPTURE_INTERVAL_MS), MAX_CAPTURE_INTERVAL_MS);
+    }
+}
+
+function scheduleCapture(run, delayMs, capture) {
+    if (run !== signRecognitionRun) return; // loop was stopped meanwhile
+    signRecognitionTimerId = setTimeout(capture, delayMs);
+}
+
 function tryStartSignRecognitionLoop(videoElement) {
-    // Guard against multiple intervals
+    // Guard against multiple capture loops
     stopSignRecognitionLoop();
 
     // Create an offscreen canvas for frame capture
@@ -757,69 +788,189 @@ function tryStartSignRecognitionLoop(videoElement) {
         offscreenCtx = offscreenCanvas.getContext('2d', { willReadFrequently: true });
     }
 
-    // Polling interval (ms)
-    const CAPTURE_INTERVAL_MS = 500; // 2 FPS (500ms between captures)
-    const TARGET_WIDTH = 320; // downscale for bandwidth; backend should accept this
+    // Prefer the WebSocket stream; fall back to HTTP polling if it can't connect
+    if ('WebSocket' in window) {
+        startStreamingRecognition(videoElement);
+    } else {
+        startPollingRecognition(videoElement);
+    }
+}
+
+async function captureFrameBlob(videoElement) {
+    const video = videoElement || document.getElementById('camera');
+    if (!video || video.readyState < 2) return null; // not enough data yet
+
+    const aspect = video.videoWidth / Math.max(1, video.videoHeight);
+    const width = TARGET_WIDTH;
+    const height = Math.round(width / aspect);
+
+    offscreenCanvas.width = width;
+    offscreenCanvas.height = height;
+    offscreenCtx.drawImage(video, 0, 0, width, height);
+
+    return new Promise(resolve => offscreenCanvas.toBlob(resolve, 'image/jpeg', 0.7));
+}
+
+function startStreamingRecognition(videoElement) {
+    let socket;
+    try {
+        socket = new WebSocket(WS_URL);
+    } catch (err) {
+        startPollingRecognition(videoElement);
+        return;
+    }
+    socket.binaryType = 'arraybuffer';
+    signRecognitionSocket = socket;
+
+    let opened = false;
+    let nextSeq = 1;
+    let lastShownSeq = 0;
+    let framesInFlight = 0;
 
-    signRecognitionIntervalId = setInterval(async () => {
-        const video = videoElement || document.getElementById('camera');
-        if (!video || video.readyState < 2) return; // not enough data yet
+    const run = signRecognitionRun;
+    captureIntervalMs = STREAM_INTERVAL_MS;
 
+    const capture = async () => {
+        if (socket.readyState !== WebSocket.OPEN) return;
         try {
-            const aspect = video.videoWidth / Math.max(1, video.videoHeight);
-            const width = TARGET_WIDTH;
-            const height = Math.round(width / aspect);
+            if (framesInFlight < MAX_FRAMES_IN_FLIGHT) {
+                const blob = await captureFrameBlob(videoElement);
+                if (!blob || socket.readyState !== WebSocket.OPEN) return;
+
+                // 4-byte big-endian frame sequence id, then the JPEG bytes
+                const header = new DataView(new ArrayBuffer(4));
+                header.setUint32(0, nextSeq++);
+                socket.send(new Blob([header.buffer, blob]));
+                framesInFlight++;
+            }
+        } catch (err) {
+            // Be silent to avoid spamming console
+        } finally {
+            // Next capture at the pace the server last asked for
+            if (socket.readyState === WebSocket.OPEN) scheduleCapture(run, captureIntervalMs, capture);
+        }
+    };
+
+    socket.onopen = () => {
+        opened = true;
+        capture();
+    };
+
+    socket.onmessage = (event) => {
+        let result;
+        try {
+            result = JSON.parse(event.data);
+        } catch (err) {
+            return;
+        }
+        // The server answers once for the newest frame and reports the rest as dropped
+        framesInFlight = Math.max(0, framesInFlight - 1 - (result.dropped || 0));
+        applyPacingHint(result);
+        if (typeof result.seq === 'number') {
+            if (result.seq <= lastShownSeq) return; // out of date
+            lastShownSeq = result.seq;
+        }
+        showRecognitionResult(result);
+    };
 
-            offscreenCanvas.width = width;
-            offscreenCanvas.height = height;
-            offscreenCtx.drawImage(video, 0, 0, width, height);
+    socket.onclose = () => {
+        if (signRecognitionSocket !== socket) return; // stopped on purpose
+        signRecognitionSocket = null;
+        if (signRecognitionTimerId) {
+            clearTimeout(signRecognitionTimerId);
+            signRecognitionTimerId = null;
+        }
+        // Server doesn't support streaming (or dropped us): keep going over HTTP
+        if (!opened || document.getElementById('camera')?.srcObject) {
+            startPollingRecognition(videoElement);
+        }
+    };
+}
 
-            const blob = await new Promise(resolve => offscreenCanvas.toBlob(resolve, 'image/jpeg', 0.7));
+function startPollingRecognition(videoElement) {
+    const run = signRecognitionRun;
+    captureIntervalMs = CAPTURE_INTERVAL_MS;
+
+    const capture = async () => {
+        let delayMs = captureIntervalMs;
+        try {
+            const blob = await captureFrameBlob(videoElement);
             if (!blob) return;
 
             const response = await fetch(API_URL, {
                 method: 'POST',
                 headers: {
                     'Accept': 'application/json',
-                    'Content-Type': 'image/jpeg'
+                    'Content-Type': 'image/jpeg',
+                    'X-Session-ID': SIGN_SESSION_ID
                 },
                 body: blob
             });
 
-            if (!response.ok) return;
-            const result = await response.json();
-            if (!result) return;
-
-            const translationText = document.getElementById('translationText');
-            if (!translationText) return;
-
-            if (result.text && typeof result.text === 'string' && result.text.trim() !== '') {
-                const arabicText = result.text.trim();
-                
-                // Check if it's an unknown prediction
-                if (arabicText === "غير معروف" || arabicText.includes("غير معروف")) {
-                    translationText.textContent = "غير معروف - حاول مرة أخرى";
-                    translationText.style.color = "#ff6b6b"; // Red color for unknown
-                    return;
-                }
-                
-                // Display only the Arabic letter
-                translationText.textContent = arabicText;
-                translationText.style.color = "#4ecdc4"; // Reset to normal color
-                
-            } else if (result.label) {
-                translationText.textContent = String(result.label);
+            const result = await response.json().catch(() => null);
+            applyPacingHint(result);
+            delayMs = captureIntervalMs;
+            if (response.status === 429) {
+                // Shed by the server: wait at least as long as it asked before the next frame
+                const retryAfterMs = Number(response.headers.get('Retry-After')) * 1000;
+                if (retryAfterMs > delayMs) delayMs = retryAfterMs;
+                return;
             }
+            if (!response.ok) return;
+            showRecognitionResult(result);
         } catch (err) {
             // Be silent to avoid spamming console; optionally log once
+        } finally {
+            scheduleCapture(run, delayMs, capture);
+        }
+    };
+
+    capture();
+}
+
+function showRecognitionResult(result) {
+    if (!result) return;
+
+    const translationText = document.getElementById('translationText');
+    if (!translationText) return;
+
+    // Words decoded by the server: committed words followed by the one being spelled
+    const words = result.words;
+    if (words && (words.partial || (words.committed && words.committed.length))) {
+        translationText.textContent = [...(words.committed || []), words.partial].filter(Boolean).join(' ');
+        translationText.style.color = "#4ecdc4";
+        return;
+    }
+
+    if (result.text && typeof result.text === 'string' && result.text.trim() !== '') {
+        const arabicText = result.text.trim();
+        
+        // Check if it's an unknown prediction
+        if (arabicText === "غير معروف" || arabicText.includes("غير معروف")) {
+            translationText.textContent = "غير معروف - حاول مرة أخرى";
+            translationText.style.color = "#ff6b6b"; // Red color for unknown
+            return;
         }
-    }, CAPTURE_INTERVAL_MS);
+        
+        // Display only the Arabic letter
+        translationText.textContent = arabicText;
+        translationText.style.color = "#4ecdc4"; // Reset to normal color
+        
+    } else if (result.label) {
+        translationText.textContent = String(result.label);
+    }
 }
 
 function stopSignRecognitionLoop() {
-    if (signRecognitionIntervalId) {
-        clearInterval(signRecognitionIntervalId);
-        signRecognitionIntervalId = null;
+    signRecognitionRun++;
+    if (signRecognitionTimerId) {
+        clearTimeout(signRecognitionTimerId);
+        signRecognitionTimerId = null;
+    }
+    if (signRecognitionSocket) {
+        const socket = signRecognitionSocket;
+        signRecognitionSocket = null;
+        socket.close();
     }
 }
 
@@ -0,0 +1,39 @@
+import os
+import sys
+import time
+from concurrent.futures import Future
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import backend
+
+
+class EchoPool:
+    """Stand-in SessionPool: returns each frame's mean as a one-column output"""
+
+    input_shape = ["batch", 1, 64, 64]
+    sessions = [None]
+
+    def run(self, batch):
+        time.sleep(0.01)
+        return batch.reshape(batch.shape[0], -1).mean(axis=1, keepdims=True)
+
+
+def test_cancelled_caller_does_not_stall_its_batch():
+    batcher = backend.InferenceBatcher(EchoPool(), max_batch_size=8, max_wait_ms=50)
+    try:
+        # Queue both before the collector starts, so it can't claim the first one before it is cancelled
+        cancelled, kept = Future(), Future()
+        assert cancelled.cancel()
+        batcher._queue.put((np.zeros((1, 1, 64, 64), dtype=np.float32), cancelled))
+        batcher._queue.put((np.ones((1, 1, 64, 64), dtype=np.float32), kept))
+        batcher._ensure_started()
+        assert kept.result(timeout=2).tolist() == [[1.0]]
+
+        # The collector is still alive for later frames
+        later = batcher.submit(np.full((2, 1, 64, 64), 2, dtype=np.float32))
+        assert later.result(timeout=2).tolist() == [[2.0], [2.0]]
+    finally:
+        batcher.close()
@@ -0,0 +1,48 @@
+import os
+import sys
+
+import numpy as np
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+os.chdir(REPO_DIR)  # The lexicon path is relative to the repo root
+
+import backend
+
+
+def row_for(label, p=0.8):
+    """A model output row that puts probability p on label's class"""
+    cls = backend.class_labels.index(label)
+    row = np.full((1, len(backend.class_labels)), (1.0 - p) / (len(backend.class_labels) - 1), dtype=np.float32)
+    row[0, cls] = p
+    return cls, row
+
+
+def test_held_letter_counts_once_however_slow_the_frames():
+    decoder = backend.WordDecoder()
+    cls, row = row_for("ب")
+    for _ in range(20):
+        decoder.observe(cls, row)
+    assert decoder.letters == 1
+    assert decoder.words_committed == 0
+
+
+def test_gap_frames_repeat_a_letter_and_end_a_word():
+    decoder = backend.WordDecoder()
+    cls, row = row_for("ب")
+    decoder.observe(cls, row)
+    for _ in range(backend.letter_gap_frames):
+        decoder.observe(None, row)
+    decoder.observe(cls, row)
+    assert decoder.state()["partial"] == "بب"
+
+    for _ in range(backend.word_gap_frames):
+        decoder.observe(None, row)
+    assert decoder.words_committed == 1
+
+
+def test_partial_shows_the_predicted_letter_over_the_lexicon_prior():
+    decoder = backend.WordDecoder()
+    cls, row = row_for("خ")
+    decoder.observe(cls, row)
+    assert decoder.state()["partial"] == "خ"